@@ -0,0 +1,7 @@
+"""
+Lazily loaded CLI subcommands.
+
+Modules in this package are only imported when their command is actually
+invoked (see LazyGroup in chatops_cli.cli.main), so their imports never
+slow down other commands or --help.
+"""
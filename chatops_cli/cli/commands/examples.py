@@ -0,0 +1,43 @@
+"""
+The `examples` subcommand — usage patterns and sample invocations.
+
+Loaded lazily by LazyGroup; this module is only imported when the user
+actually runs `chatops examples`.
+"""
+
+import click
+from rich.panel import Panel
+
+from ..main import CLIContext, console, pass_context
+
+
+@click.command()
+@pass_context
+def examples(ctx: CLIContext):
+    """Show example commands and usage patterns"""
+    console.print(Panel.fit(
+        "[bold blue]ChatOps CLI Examples[/bold blue]\n\n"
+        "[green]Basic Commands:[/green]\n"
+        "  chatops ask 'check disk space'\n"
+        "  chatops ask 'restart nginx service'\n"
+        "  chatops ask 'show running containers'\n\n"
+        "[green]Interactive Mode:[/green]\n"
+        "  chatops chat\n"
+        "  chatops chat --model llama3-8b-8192\n\n"
+        "[green]Command Explanation:[/green]\n"
+        "  chatops explain 'docker ps -a'\n"
+        "  chatops explain 'kubectl get pods'\n\n"
+        "[green]Plugin Management:[/green]\n"
+        "  chatops plugins --list\n"
+        "  chatops plugins --status\n"
+        "  chatops plugins --help-plugin docker\n\n"
+        "[green]Configuration:[/green]\n"
+        "  chatops config --validate\n"
+        "  chatops config --export-template\n"
+        "  chatops config --save-profile production\n\n"
+        "[green]Advanced Options:[/green]\n"
+        "  chatops --verbose ask 'analyze system performance'\n"
+        "  chatops --debug ask 'troubleshoot network issues'\n"
+        "  chatops ask --dry-run 'delete old log files'",
+        title="[bold cyan]Example Commands[/bold cyan]"
+    ))
@@ -6,12 +6,16 @@ This module provides the primary command-line interface using Click framework,
 with command groups, global options, and integration with our core components.
 """
 
+from __future__ import annotations
+
 import sys
 import logging
 import asyncio
-from datetime import datetime
+import time
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Optional
 
 # Try to import readline, but make it optional (not available on Windows)
 try:
@@ -20,41 +24,129 @@ try:
 except ImportError:
     READLINE_AVAILABLE = False
 
+# Use uvloop's libuv-based event loop when available (POSIX only) — a
+# drop-in asyncio replacement that is 2-4x faster than the stock
+# selector loop for the network-bound awaits this CLI is built around.
+if sys.platform != "win32":
+    try:
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
 import click
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.prompt import Prompt
+from rich.text import Text
 
 from ..settings import settings
-from ..core.groq_client import GroqClient, GroqResponse
-from ..core.langchain_integration import LangChainIntegration, DevOpsCommand, RiskLevel
-from ..core.command_executor import CommandExecutor, ExecutionContext, ExecutionStatus
-from ..plugins import PluginManager
+
+# Heavy core/langchain imports are deferred to first use — importing the
+# langchain stack alone costs hundreds of ms, which would otherwise be
+# paid even by `chatops --version` and `chatops --help`.
+if TYPE_CHECKING:
+    from ..core.command_executor import CommandExecutor
+    from ..core.groq_client import GroqClient, GroqResponse
+    from ..core.langchain_integration import DevOpsCommand, LangChainIntegration
+    from ..core.plan_cache import PlanCache
+    from ..core.prompt_cache import PromptCache
+    from ..plugins import PluginManager
 
 
 # Global console for rich output
 console = Console()
 
 
+# Persistent event loop shared by every command in a CLI invocation.
+# Each asyncio.run() call builds and tears down a fresh loop (epoll fd,
+# socketpair, executor shutdown, transport GC); reusing one loop keeps
+# connection pools and plugin state warm across awaits.
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _run(coro):
+    """Run a coroutine to completion on the persistent CLI event loop"""
+    global _LOOP
+    if _LOOP is None or _LOOP.is_closed():
+        _LOOP = asyncio.new_event_loop()
+        asyncio.set_event_loop(_LOOP)
+    return _LOOP.run_until_complete(coro)
+
+
 # Global context for CLI state
 class CLIContext:
     def __init__(self) -> None:
         self.debug = False
         self.verbose = False
         self.config_file: Optional[str] = None
-        self.groq_client: Optional[GroqClient] = None
-        self.langchain: Optional[LangChainIntegration] = None
-        self.plugin_manager: Optional[PluginManager] = None
-        self.command_executor: Optional[CommandExecutor] = None
+        # Core components are built lazily on first attribute access so
+        # commands only pay for what they actually use
+        self._groq_client: Optional[GroqClient] = None
+        self._langchain: Optional[LangChainIntegration] = None
+        self._plugin_manager: Optional[PluginManager] = None
+        self._command_executor: Optional[CommandExecutor] = None
         self.logging_system: Optional[Any] = None  # Will be set in setup_logging
+        # Execution-plan cache (lazy; only opened in chat mode)
+        self.plan_cache: Optional[PlanCache] = None
+        self.use_plan_cache: bool = True
+        # Prompt-response cache for ask/explain (lazy)
+        self._prompt_cache: Optional[PromptCache] = None
         # Interactive session state
         self.chat_history: list[dict[str, Any]] = []
         self.session_context: str = ""
         self.session_start_time: Optional[datetime] = None
+        self.session_start_monotonic: Optional[float] = None
         self.command_count: int = 0
 
+    @property
+    def groq_client(self) -> GroqClient:
+        """Groq API client, constructed on first use"""
+        if self._groq_client is None:
+            from ..core.groq_client import GroqClient
+
+            self._groq_client = GroqClient()
+        return self._groq_client
+
+    @property
+    def langchain(self) -> LangChainIntegration:
+        """LangChain integration, constructed on first use"""
+        if self._langchain is None:
+            from ..core.langchain_integration import LangChainIntegration
+
+            self._langchain = LangChainIntegration()
+        return self._langchain
+
+    @property
+    def plugin_manager(self) -> PluginManager:
+        """Plugin manager, constructed on first use"""
+        if self._plugin_manager is None:
+            from ..plugins import PluginManager
+
+            self._plugin_manager = PluginManager()
+        return self._plugin_manager
+
+    @property
+    def prompt_cache(self) -> PromptCache:
+        """Prompt-response cache, constructed on first use"""
+        if self._prompt_cache is None:
+            from ..core.prompt_cache import PromptCache
+
+            self._prompt_cache = PromptCache()
+        return self._prompt_cache
+
+    @property
+    def command_executor(self) -> CommandExecutor:
+        """Command executor, constructed on first use"""
+        if self._command_executor is None:
+            from ..core.command_executor import CommandExecutor
+
+            self._command_executor = CommandExecutor()
+        return self._command_executor
+
     def setup_logging(self) -> None:
         """Setup logging based on debug/verbose flags"""
         # Initialize the comprehensive logging system
@@ -86,7 +178,49 @@ class CLIContext:
 pass_context = click.make_pass_decorator(CLIContext, ensure=True)
 
 
-@click.group()
+class LazyGroup(click.Group):
+    """
+    Click group that imports subcommand modules only when invoked.
+
+    Commands registered in lazy_subcommands (as "module:attribute"
+    strings) aren't imported at startup, so their dependencies are never
+    paid by other commands or by --help. This is the lazy-subcommand
+    pattern from Click's documentation.
+    """
+
+    def __init__(self, *args, lazy_subcommands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands: dict[str, str] = lazy_subcommands or {}
+
+    def list_commands(self, ctx):
+        return sorted(super().list_commands(ctx) + list(self.lazy_subcommands))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands:
+            return self._load_lazy(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load_lazy(self, cmd_name: str) -> click.Command:
+        import importlib
+
+        module_name, attr = self.lazy_subcommands[cmd_name].split(":", 1)
+        command = getattr(importlib.import_module(module_name), attr)
+        if not isinstance(command, click.Command):
+            raise ValueError(
+                f"Lazy command {self.lazy_subcommands[cmd_name]!r} "
+                f"is not a click.Command"
+            )
+        return command
+
+
+# Self-contained subcommands live in cli/commands/ and are loaded on
+# demand; commands sharing helpers in this module stay registered here.
+_LAZY_SUBCOMMANDS = {
+    "examples": "chatops_cli.cli.commands.examples:examples",
+}
+
+
+@click.group(cls=LazyGroup, lazy_subcommands=_LAZY_SUBCOMMANDS)
 @click.option("--debug", is_flag=True, help="Enable debug mode with detailed logging")
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose output")
 @click.option(
@@ -111,11 +245,9 @@ def cli(ctx: CLIContext, debug: bool, verbose: bool, config: Optional[str]):
     ctx.config_file = config
     ctx.setup_logging()
 
-    # Initialize core components
-    ctx.groq_client = GroqClient()
-    ctx.langchain = LangChainIntegration()
-    ctx.plugin_manager = PluginManager()
-    ctx.command_executor = CommandExecutor()
+    # Core components (groq_client, langchain, plugin_manager,
+    # command_executor) are lazy properties on CLIContext — nothing
+    # heavyweight is constructed until a command actually uses it.
 
     if debug:
         console.print("[dim]Debug mode enabled[/dim]", style="blue")
@@ -159,109 +291,15 @@ def ask(
             console=console,
             transient=True,
         ) as progress:
-            # Initialize plugin manager if not already done
-            if not ctx.plugin_manager._plugins:
-                task = progress.add_task("Initializing plugins...", total=None)
-                success = asyncio.run(
-                    ctx.plugin_manager.initialize({"hot_reload": ctx.debug})
-                )
-                if not success:
-                    console.print(
-                        "⚠️ [yellow]Warning: Plugin system initialization failed[/yellow]"
-                    )
-
-                if ctx.verbose:
-                    plugin_count = len(ctx.plugin_manager)
-                    console.print(f"[dim]Loaded {plugin_count} plugins[/dim]")
-
-            # Try plugin system first
-            task = progress.add_task("Finding plugin handler...", total=None)
-
-            plugin_context = {
-                "user_request": request,
-                "additional_context": context,
-                "explain_mode": explain,
-                "dry_run": dry_run,
-            }
-
-            handler_plugin = asyncio.run(
-                ctx.plugin_manager.find_handler(request, plugin_context)
+            # One loop entry for the whole async sequence instead of a
+            # fresh asyncio.run() per await
+            response = _run(
+                _ask_pipeline(ctx, request, dry_run, explain, model, context, progress)
             )
 
-            if handler_plugin:
-                progress.update(
-                    task, description=f"Using {handler_plugin.metadata.name} plugin..."
-                )
-
-                # Generate command using plugin
-                command = asyncio.run(
-                    handler_plugin.generate_command(request, plugin_context)
-                )
-
-                if command:
-                    if ctx.verbose:
-                        console.print(
-                            f"[dim]Command generated by {handler_plugin.metadata.name} plugin[/dim]"
-                        )
-
-                    # Validate command with plugin
-                    if asyncio.run(
-                        handler_plugin.validate_command(command, plugin_context)
-                    ):
-                        if explain:
-                            # Show explanation for the command
-                            explanation = handler_plugin.get_help()
-                            console.print(
-                                Panel(
-                                    explanation,
-                                    title=f"Plugin Help: {handler_plugin.metadata.name}",
-                                    border_style="blue",
-                                )
-                            )
-                        else:
-                            # Display and potentially execute the command
-                            _display_command(command, dry_run, ctx.verbose)
-
-                            if not dry_run:
-                                asyncio.run(_execute_command(command, ctx, ctx.verbose))
-                        return
-                    else:
-                        console.print(
-                            "⚠️ [yellow]Plugin command validation failed, falling back to AI[/yellow]"
-                        )
-
-            # Fallback to original LangChain + Ollama approach
-            if ctx.verbose:
-                console.print("[dim]No plugin found, using AI fallback...[/dim]")
-
-            task = progress.add_task("Connecting to Ollama...", total=None)
-
-            connected = asyncio.run(ctx.groq_client.connect())
-            if not connected:
-                console.print("❌ [red]Failed to connect to Groq API[/red]")
-                console.print(
-                    "💡 [yellow]Check your GROQ_API_KEY in .env file[/yellow]"
-                )
-                sys.exit(1)
-
-            progress.update(task, description="Generating command...")
-
-            # Generate prompt using LangChain
-            prompt = ctx.langchain.generate_command(request, context or "")
-
-            if explain:
-                # Use explanation template instead
-                prompt = ctx.langchain.explain_command(request)
-                progress.update(task, description="Generating explanation...")
-
-            # Get response from Ollama
-            progress.update(task, description="Waiting for AI response...")
-
-            response = asyncio.run(ctx.groq_client.generate_response(
-                prompt=prompt,
-                max_tokens=200 if explain else 100,
-                temperature=0.1,
-            ))
+        if response is None:
+            # Handled entirely by a plugin
+            return
 
         if not response.success:
             console.print(f"❌ [red]AI request failed: {response.error}[/red]")
@@ -295,12 +333,15 @@ def ask(
 
             # Execute if not dry run and user confirms
             if not dry_run:
-                asyncio.run(_execute_command(command, ctx, ctx.verbose))
+                _run(_execute_command(command, ctx, ctx.verbose))
 
     except KeyboardInterrupt:
         console.print("\n⏹️ [yellow]Operation cancelled by user[/yellow]")
         sys.exit(1)
     except Exception as e:
+        # logging.exception is cheap when no handler is attached, unlike
+        # rendering a Rich traceback, so always record it there.
+        logging.getLogger(__name__).exception("ask command failed")
         if ctx.debug:
             console.print_exception()
         else:
@@ -308,16 +349,191 @@ def ask(
         sys.exit(1)
 
 
+async def _ask_pipeline(
+    ctx: CLIContext,
+    request: str,
+    dry_run: bool,
+    explain: bool,
+    model: Optional[str],
+    context: Optional[str],
+    progress: Progress,
+) -> Optional[GroqResponse]:
+    """Run the full ask flow (plugins, then AI fallback) in one coroutine.
+
+    Returns the GroqResponse from the AI fallback, or None when a plugin
+    handled the request end to end.
+    """
+    # Pure explanation requests never need command generation — skip
+    # plugin initialization and handler dispatch and go straight to a
+    # single LLM call
+    if explain:
+        return await _explain_pipeline(ctx, request, model, progress)
+
+    # Check the prompt-response cache before anything else — a hit means
+    # the AI answered this exact request before (plugins didn't claim it
+    # then either), so plugin init and handler dispatch can be skipped
+    # entirely and the whole ask is a sub-millisecond local lookup
+    from ..core.groq_client import GroqResponse
+    from ..core.prompt_cache import PromptCache
+
+    cache_key = PromptCache.make_key("ask", request, model, explain)
+    cached_content = ctx.prompt_cache.get(cache_key)
+    if cached_content is not None:
+        if ctx.verbose:
+            console.print("[dim]Using cached AI response[/dim]")
+        return GroqResponse(content=cached_content, success=True, model=model)
+
+    # One spinner task for the whole pipeline; each stage just updates
+    # the description instead of adding a task (every add_task forces a
+    # Rich re-render, and most stages finish before a refresh anyway)
+    task = progress.add_task("Processing request...", total=None)
+
+    # Initialize plugin manager if not already done
+    if not ctx.plugin_manager._plugins:
+        progress.update(task, description="Initializing plugins...")
+        success = await ctx.plugin_manager.initialize({"hot_reload": ctx.debug})
+        if not success:
+            console.print(
+                "⚠️ [yellow]Warning: Plugin system initialization failed[/yellow]"
+            )
+
+        if ctx.verbose:
+            plugin_count = len(ctx.plugin_manager)
+            console.print(f"[dim]Loaded {plugin_count} plugins[/dim]")
+
+    # Try plugin system first
+    progress.update(task, description="Finding plugin handler...")
+
+    plugin_context = {
+        "user_request": request,
+        "additional_context": context,
+        "explain_mode": explain,
+        "dry_run": dry_run,
+    }
+
+    handler_plugin = await ctx.plugin_manager.find_handler(request, plugin_context)
+
+    if handler_plugin:
+        progress.update(
+            task, description=f"Using {handler_plugin.metadata.name} plugin..."
+        )
+
+        # Generate command using plugin
+        command = await handler_plugin.generate_command(request, plugin_context)
+
+        if command:
+            # Gate on verbose before building the f-string so the
+            # common quiet path skips the formatting work entirely.
+            if ctx.verbose:
+                console.print(
+                    f"[dim]Command generated by {handler_plugin.metadata.name} plugin[/dim]"
+                )
+
+            # Validate command with plugin (explain mode never reaches
+            # here — it branches to _explain_pipeline up top)
+            if await handler_plugin.validate_command(command, plugin_context):
+                _display_command(command, dry_run, ctx.verbose)
+
+                if not dry_run:
+                    await _execute_command(command, ctx, ctx.verbose)
+                return None
+            else:
+                console.print(
+                    "⚠️ [yellow]Plugin command validation failed, falling back to AI[/yellow]"
+                )
+
+    # Fallback to original LangChain + Ollama approach (the cache was
+    # already checked before plugin dispatch)
+    if ctx.verbose:
+        console.print("[dim]No plugin found, using AI fallback...[/dim]")
+
+    progress.update(task, description="Connecting to Ollama...")
+
+    connected = await ctx.groq_client.connect()
+    if not connected:
+        console.print("❌ [red]Failed to connect to Groq API[/red]")
+        console.print("💡 [yellow]Check your GROQ_API_KEY in .env file[/yellow]")
+        sys.exit(1)
+
+    progress.update(task, description="Generating command...")
+
+    # Static instructions go in the system prompt (byte-identical across
+    # calls so provider-side prefix caching hits); only the user message
+    # carries per-request content
+    system_prompt = ctx.langchain.get_static_system_prompt()
+    prompt = ctx.langchain.build_user_message(request, context or "")
+
+    # Get response from Ollama
+    progress.update(task, description="Waiting for AI response...")
+
+    response = await ctx.groq_client.generate_response(
+        prompt=prompt,
+        system_prompt=system_prompt,
+        max_tokens=100,
+        temperature=0.1,
+    )
+
+    if response.success:
+        ctx.prompt_cache.put(cache_key, response.content, response.model)
+
+    return response
+
+
+async def _explain_pipeline(
+    ctx: CLIContext,
+    request: str,
+    model: Optional[str],
+    progress: Progress,
+) -> GroqResponse:
+    """Explain a request with one LLM call, bypassing the plugin system.
+
+    Explanation mode generates prose, not a command, so it needs no
+    plugin scan, no handler dispatch, and no command validation.
+    """
+    from ..core.groq_client import GroqResponse
+    from ..core.prompt_cache import PromptCache
+
+    cache_key = PromptCache.make_key("ask", request, model, True)
+    cached_content = ctx.prompt_cache.get(cache_key)
+    if cached_content is not None:
+        if ctx.verbose:
+            console.print("[dim]Using cached AI response[/dim]")
+        return GroqResponse(content=cached_content, success=True, model=model)
+
+    task = progress.add_task("Connecting to AI...", total=None)
+
+    connected = await ctx.groq_client.connect()
+    if not connected:
+        console.print("❌ [red]Failed to connect to Groq API[/red]")
+        console.print("💡 [yellow]Check your GROQ_API_KEY in .env file[/yellow]")
+        sys.exit(1)
+
+    progress.update(task, description="Generating explanation...")
+
+    response = await ctx.groq_client.generate_response(
+        prompt=ctx.langchain.explain_command(request),
+        max_tokens=200,
+        temperature=0.1,
+    )
+
+    if response.success:
+        ctx.prompt_cache.put(cache_key, response.content, response.model)
+
+    return response
+
+
 @cli.command()
 @click.option("--model", "-m", help="Specific model to use for the session")
 @click.option("--context", "-ctx", help="Initial context for the chat session")
 @click.option("--save-history", is_flag=True, help="Save chat history to file on exit")
+@click.option("--no-cache", is_flag=True, help="Bypass the execution-plan cache")
 @pass_context
 def chat(
     ctx: CLIContext,
     model: Optional[str],
     context: Optional[str],
     save_history: bool,
+    no_cache: bool,
 ):
     """
     Start an interactive chat session with persistent context and command history.
@@ -341,8 +557,15 @@ def chat(
     """
     # Initialize session
     ctx.session_start_time = datetime.now()
+    ctx.session_start_monotonic = time.monotonic()
     ctx.command_count = 0
-    
+    ctx.use_plan_cache = not no_cache
+    if ctx.use_plan_cache and ctx.plan_cache is None:
+        from ..core.plan_cache import PlanCache
+
+        ctx.plan_cache = PlanCache()
+
+
     if context:
         ctx.session_context = context
         console.print(f"[dim]Session context set to: {context}[/dim]")
@@ -370,16 +593,15 @@ def chat(
             console=console,
             transient=True,
         ) as progress:
-            # Initialize core components if not already done
-            if not ctx.langchain:
-                ctx.langchain = LangChainIntegration()
-            if not ctx.command_executor:
-                ctx.command_executor = CommandExecutor()
-                
+            # Touch the lazy components so construction cost is paid
+            # here, behind the spinner, rather than mid-conversation
+            ctx.langchain
+            ctx.command_executor
+
             # Initialize plugin manager
             if not ctx.plugin_manager._plugins:
                 task = progress.add_task("Initializing plugins...", total=None)
-                success = asyncio.run(
+                success = _run(
                     ctx.plugin_manager.initialize({"hot_reload": ctx.debug})
                 )
                 if not success:
@@ -387,7 +609,7 @@ def chat(
                     
             # Initialize AI connection
             task = progress.add_task("Connecting to AI service...", total=None)
-            connected = asyncio.run(ctx.groq_client.connect())
+            connected = _run(ctx.groq_client.connect())
             if not connected:
                 console.print("❌ [red]Failed to connect to Groq API[/red]")
                 console.print("💡 [yellow]Check your GROQ_API_KEY in .env file[/yellow]")
@@ -401,37 +623,40 @@ def chat(
     _display_chat_welcome(ctx)
     
     # Main interactive loop
+    # Pre-bind console.print so the loop body avoids repeated
+    # global + attribute lookups on every iteration.
+    _print = console.print
     try:
         while True:
             try:
                 # Get user input with readline support
                 user_input = _get_user_input(ctx).strip()
-                
+
                 if not user_input:
                     continue
-                    
+
                 # Handle special commands
                 if user_input.startswith('/'):
                     if _handle_chat_command(user_input, ctx, save_history):
                         break  # Exit requested
                     continue
-                
+
                 # Process regular chat input
                 ctx.command_count += 1
                 _process_chat_input(user_input, ctx, model)
-                
+
             except KeyboardInterrupt:
-                console.print("\n\n[yellow]Use /exit to quit or Ctrl+C again to force exit[/yellow]")
+                _print("\n\n[yellow]Use /exit to quit or Ctrl+C again to force exit[/yellow]")
                 try:
                     # Give user a chance to type /exit
                     continue
                 except KeyboardInterrupt:
-                    console.print("\n[red]Force exit requested[/red]")
+                    _print("\n[red]Force exit requested[/red]")
                     break
-                    
+
             except EOFError:
                 # Ctrl+D pressed
-                console.print("\n[yellow]EOF detected, exiting chat...[/yellow]")
+                _print("\n[yellow]EOF detected, exiting chat...[/yellow]")
                 break
                 
     except Exception as e:
@@ -459,6 +684,21 @@ def explain(ctx: CLIContext, command: str):
         chatops explain "docker ps -a"
     """
     try:
+        from ..core.prompt_cache import PromptCache
+
+        # Serve repeat explanations from the local cache
+        cache_key = PromptCache.make_key("explain", command)
+        cached_content = ctx.prompt_cache.get(cache_key)
+        if cached_content is not None:
+            console.print(
+                Panel(
+                    cached_content.strip(),
+                    title=f"Command Explanation: {command}",
+                    border_style="green",
+                )
+            )
+            return
+
         # Use LangChain explanation template
         prompt = ctx.langchain.explain_command(command)
 
@@ -468,36 +708,36 @@ def explain(ctx: CLIContext, command: str):
             console=console,
             transient=True,
         ) as progress:
-            task = progress.add_task("Connecting to AI...", total=None)
+            progress.add_task("Connecting to AI...", total=None)
 
             # Check connection
-            connected = asyncio.run(ctx.groq_client.connect())
-            if not connected:
-                # Fallback to offline explanation
-                _offline_command_explanation(command)
-                return
+            connected = _run(ctx.groq_client.connect())
 
-            progress.update(task, description="Generating explanation...")
+        if not connected:
+            # Fallback to offline explanation
+            _offline_command_explanation(command)
+            return
 
-            response = asyncio.run(
-                ctx.groq_client.generate_response( # Changed from ctx.ollama_client to ctx.groq_client
+        # Stream the explanation into a live panel so the user starts
+        # reading at the first token instead of the last
+        content = _run(
+            _stream_to_panel(
+                ctx.groq_client.generate_response_stream(
                     prompt=prompt, max_tokens=300, temperature=0.2
-                )
+                ),
+                title=f"Command Explanation: {command}",
+                border_style="green",
             )
+        )
 
-        if response.success:
-            console.print(
-                Panel(
-                    response.content.strip(),
-                    title=f"Command Explanation: {command}",
-                    border_style="green",
-                )
-            )
+        if content.strip():
+            ctx.prompt_cache.put(cache_key, content)
         else:
             # Fallback to offline explanation
             _offline_command_explanation(command)
 
     except Exception as e:
+        logging.getLogger(__name__).exception("explain command failed")
         if ctx.debug:
             console.print_exception()
         else:
@@ -505,6 +745,49 @@ def explain(ctx: CLIContext, command: str):
             _offline_command_explanation(command)
 
 
+async def _collect_status(ctx: CLIContext):
+    """
+    Run the independent status health checks concurrently.
+
+    The Groq connection probe and the LangChain check don't depend on
+    each other, and the per-model memory probes are independent network
+    calls, so everything runs under asyncio.gather — total wall time is
+    the slowest check instead of the sum of all of them.
+    """
+    loop = asyncio.get_running_loop()
+
+    async def _groq_check():
+        try:
+            return await ctx.groq_client.connect()
+        except Exception:
+            return None  # None = errored, False = cleanly disconnected
+
+    async def _langchain_check():
+        try:
+            return await loop.run_in_executor(
+                None, lambda: ctx.langchain.command_example_count
+            )
+        except Exception:
+            return None
+
+    connected, example_count = await asyncio.gather(
+        _groq_check(), _langchain_check()
+    )
+
+    # Groq is a hosted API: the model catalog is a local list and there
+    # is no per-model memory to probe (that was an Ollama concept whose
+    # leftover calls raised AttributeError and were swallowed by the
+    # old except clause, so status always reported "Unable to check")
+    models = []
+    if connected:
+        try:
+            models = ctx.groq_client.list_available_models()
+        except Exception:
+            models = []
+
+    return connected, example_count, models
+
+
 @cli.command()
 @pass_context
 def status(ctx: CLIContext):
@@ -515,39 +798,34 @@ def status(ctx: CLIContext):
         Panel("[bold blue]ChatOps CLI System Status[/bold blue]", border_style="blue")
     )
 
+    connected, example_count, models = _run(_collect_status(ctx))
+
     # Create status table
     table = Table(show_header=True, header_style="bold magenta")
     table.add_column("Component", style="cyan")
     table.add_column("Status", style="green")
     table.add_column("Details", style="dim")
 
-    # Check Groq connection
-    try:
-        connected = asyncio.run(ctx.groq_client.connect())
+    # Groq connection
+    if connected is None:
+        groq_status = "❌ Error"
+        groq_details = "Groq service not available"
+    else:
         groq_status = "✅ Connected" if connected else "❌ Disconnected"
         groq_details = (
             "Ready for AI requests" if connected else "Check GROQ_API_KEY in .env"
         )
-    except:
-        groq_status = "❌ Error"
-        groq_details = "Groq service not available"
 
     table.add_row("Groq Service", groq_status, groq_details)
 
-    # Check models
-    model_count = 0
-    if connected:
-        try:
-            models = ctx.groq_client.list_models() # Changed from ctx.ollama_client to ctx.groq_client
-            model_count = len(models)
-            working_models = sum(
-                1 for m in models if ctx.groq_client._test_model_memory(m.name) # Changed from ctx.ollama_client to ctx.groq_client
-            )
-            model_details = f"{working_models}/{model_count} models can run"
-        except:
-            model_details = "Unable to check models"
-    else:
+    # Models
+    model_count = len(models)
+    if not connected:
         model_details = "Service offline"
+    elif not models:
+        model_details = "Unable to check models"
+    else:
+        model_details = f"{model_count} Groq models available"
 
     table.add_row(
         "AI Models",
@@ -556,11 +834,10 @@ def status(ctx: CLIContext):
     )
 
     # LangChain status
-    try:
-        examples = ctx.langchain.get_command_examples()
+    if example_count is not None:
         langchain_status = "✅ Ready"
-        langchain_details = f"{len(examples)} command categories loaded"
-    except:
+        langchain_details = f"{example_count} command categories loaded"
+    else:
         langchain_status = "❌ Error"
         langchain_details = "LangChain integration failed"
 
@@ -573,15 +850,11 @@ def status(ctx: CLIContext):
         console.print("\n[bold]Available Models:[/bold]")
         model_table = Table(show_header=True)
         model_table.add_column("Model", style="cyan")
-        model_table.add_column("Size", style="yellow")
         model_table.add_column("Status", style="green")
 
-        for model in models:
-            status_emoji = (
-                "✅" if ctx.groq_client._test_model_memory(model.name) else "⚠️" # Changed from ctx.ollama_client to ctx.groq_client
-            )
-            status_text = "Ready" if status_emoji == "✅" else "Memory Issue"
-            model_table.add_row(model.name, model.size, f"{status_emoji} {status_text}")
+        for model_name in models:
+            marker = " (default)" if model_name == settings.groq_model else ""
+            model_table.add_row(model_name, f"✅ Available{marker}")
 
         console.print(model_table)
 
@@ -771,13 +1044,7 @@ def preview(ctx: CLIContext, command: str):
                        title="🔍 Security Analysis"))
     
     # Risk assessment
-    risk_color = {
-        "safe": "green",
-        "low": "yellow", 
-        "medium": "orange",
-        "high": "red",
-        "critical": "red"
-    }.get(preview.risk_level.value, "white")
+    risk_color = _RISK_COLORS.get(preview.risk_level.value, "white")
     
     console.print(f"[bold]Risk Level:[/bold] [{risk_color}]{preview.risk_level.value.upper()}[/{risk_color}]")
     console.print(f"[bold]Operation Type:[/bold] {preview.operation_type.value}")
@@ -907,7 +1174,7 @@ def rollback(ctx: CLIContext, command_id: str):
     console.print(f"[yellow]Executing rollback for command {command_id}...[/yellow]")
     
     # Execute rollback
-    success = asyncio.run(security_system.execute_rollback(command_id))
+    success = _run(security_system.execute_rollback(command_id))
     
     if success:
         console.print(Panel(f"✅ Rollback completed successfully for {command_id}", style="green"))
@@ -954,38 +1221,6 @@ def rollback_history(ctx: CLIContext, limit: int):
     console.print(table)
 
 
-@cli.command()
-@pass_context
-def examples(ctx: CLIContext):
-    """Show example commands and usage patterns"""
-    console.print(Panel.fit(
-        "[bold blue]ChatOps CLI Examples[/bold blue]\n\n"
-        "[green]Basic Commands:[/green]\n"
-        "  chatops ask 'check disk space'\n"
-        "  chatops ask 'restart nginx service'\n"
-        "  chatops ask 'show running containers'\n\n"
-        "[green]Interactive Mode:[/green]\n"
-        "  chatops chat\n"
-        "  chatops chat --model llama3-8b-8192\n\n"
-        "[green]Command Explanation:[/green]\n"
-        "  chatops explain 'docker ps -a'\n"
-        "  chatops explain 'kubectl get pods'\n\n"
-        "[green]Plugin Management:[/green]\n"
-        "  chatops plugins --list\n"
-        "  chatops plugins --status\n"
-        "  chatops plugins --help-plugin docker\n\n"
-        "[green]Configuration:[/green]\n"
-        "  chatops config --validate\n"
-        "  chatops config --export-template\n"
-        "  chatops config --save-profile production\n\n"
-        "[green]Advanced Options:[/green]\n"
-        "  chatops --verbose ask 'analyze system performance'\n"
-        "  chatops --debug ask 'troubleshoot network issues'\n"
-        "  chatops ask --dry-run 'delete old log files'",
-        title="[bold cyan]Example Commands[/bold cyan]"
-    ))
-
-
 @cli.group()
 @pass_context
 def config(ctx: CLIContext):
@@ -1171,7 +1406,7 @@ def plugins(
                 transient=True,
             ) as progress:
                 task = progress.add_task("Initializing plugins...", total=None)
-                success = asyncio.run(
+                success = _run(
                     ctx.plugin_manager.initialize({"hot_reload": ctx.debug})
                 )
                 if not success:
@@ -1187,12 +1422,12 @@ def plugins(
             plugins_table.add_column("Capabilities", style="blue")
             plugins_table.add_column("Description", style="white")
 
-            all_plugins = ctx.plugin_manager.get_all_plugins()
+            all_plugin_info = ctx.plugin_manager.get_all_plugin_info()
 
-            for name, plugin in all_plugins.items():
-                info = ctx.plugin_manager.get_plugin_info(name)
+            for name, info in all_plugin_info.items():
+                plugin = info.instance
                 status_emoji = "✅" if info.status.value == "active" else "❌"
-                capabilities = ", ".join([cap.value for cap in plugin.capabilities])
+                capabilities = plugin.capabilities_str
 
                 plugins_table.add_row(
                     name,
@@ -1203,7 +1438,7 @@ def plugins(
                 )
 
             console.print(plugins_table)
-            console.print(f"\n📊 Total plugins loaded: {len(all_plugins)}")
+            console.print(f"\n📊 Total plugins loaded: {len(all_plugin_info)}")
             return
 
         # Show plugin status
@@ -1248,7 +1483,7 @@ def plugins(
                 transient=True,
             ) as progress:
                 task = progress.add_task(f"Reloading plugin '{reload}'...", total=None)
-                success = asyncio.run(ctx.plugin_manager.reload_plugin(reload))
+                success = ctx.plugin_manager.reload_plugin_sync(reload)
 
                 if success:
                     console.print(
@@ -1277,49 +1512,51 @@ def plugins(
             console.print(f"❌ [red]Plugin operation failed: {e}[/red]")
 
 
+# Risk level styling, keyed by enum value so the constant doesn't force
+# the langchain module import at CLI startup
+_RISK_COLORS = MappingProxyType({
+    "safe": "green",
+    "low": "yellow",
+    "medium": "orange3",
+    "high": "red",
+    "critical": "bold red",
+})
+
+
 def _display_command(command: DevOpsCommand, dry_run: bool, verbose: bool):
     """Display command information in a formatted way"""
+    risk_color = _RISK_COLORS.get(command.risk_level.value, "white")
 
-    # Risk level styling
-    risk_colors = {
-        RiskLevel.SAFE: "green",
-        RiskLevel.LOW: "yellow",
-        RiskLevel.MEDIUM: "orange3",
-        RiskLevel.HIGH: "red",
-        RiskLevel.CRITICAL: "bold red",
-    }
-
-    risk_color = risk_colors.get(command.risk_level, "white")
+    # Build the info panel from styled Text in a headerless table —
+    # styles are applied directly instead of round-tripping through
+    # Rich markup parsing on every ask
+    info = Table(show_header=False, box=None, pad_edge=False)
+    info.add_column(style="bold", no_wrap=True)
+    info.add_column()
 
-    # Create info panel
-    info_lines = [
-        f"[bold]Command:[/bold] [cyan]{command.command}[/cyan]",
-        f"[bold]Description:[/bold] {command.description}",
-        f"[bold]Type:[/bold] {command.command_type.value}",
-        f"[bold]Risk Level:[/bold] [{risk_color}]{command.risk_level.value}[/{risk_color}]",
-        f"[bold]Duration:[/bold] {command.estimated_duration}",
-    ]
+    info.add_row("Command:", Text(command.command, style="cyan"))
+    info.add_row("Description:", command.description)
+    info.add_row("Type:", command.command_type.value)
+    info.add_row("Risk Level:", Text(command.risk_level.value, style=risk_color))
+    info.add_row("Duration:", command.estimated_duration)
 
     if command.requires_sudo:
-        info_lines.append("[bold]Privileges:[/bold] [red]Requires sudo[/red]")
+        info.add_row("Privileges:", Text("Requires sudo", style="red"))
 
     if command.prerequisites:
-        prereqs = ", ".join(command.prerequisites)
-        info_lines.append(f"[bold]Prerequisites:[/bold] {prereqs}")
+        info.add_row("Prerequisites:", ", ".join(command.prerequisites))
 
     if command.alternative_commands and verbose:
-        alts = ", ".join(command.alternative_commands)
-        info_lines.append(f"[bold]Alternatives:[/bold] {alts}")
+        info.add_row("Alternatives:", ", ".join(command.alternative_commands))
 
     panel_title = "Generated Command (Dry Run)" if dry_run else "Generated Command"
-    console.print(
-        Panel("\n".join(info_lines), title=panel_title, border_style=risk_color)
-    )
+    console.print(Panel(info, title=panel_title, border_style=risk_color))
 
 
 async def _execute_command(command: DevOpsCommand, ctx: CLIContext, verbose: bool):
     """Handle command execution with safety checks using CommandExecutor"""
-    
+    from ..core.command_executor import ExecutionContext
+
     # Create execution context
     execution_context = ExecutionContext(
         working_directory=Path.cwd(), 
@@ -1362,6 +1599,8 @@ async def _execute_command(command: DevOpsCommand, ctx: CLIContext, verbose: boo
 
 def _display_execution_result(result, verbose: bool):
     """Display command execution results"""
+    from ..core.command_executor import ExecutionStatus
+
     status_colors = {
         ExecutionStatus.COMPLETED: "green",
         ExecutionStatus.FAILED: "red", 
@@ -1391,32 +1630,93 @@ def _display_execution_result(result, verbose: bool):
         console.print("⏹️ [yellow]Command execution was cancelled by user[/yellow]")
 
 
-def _offline_command_explanation(command: str):
-    """Provide basic offline command explanation"""
+async def _stream_to_panel(chunks, title: str, border_style: str = "green") -> str:
+    """Render an async stream of text chunks into a live-updating Panel.
 
-    # Basic command explanations (fallback when AI is unavailable)
-    explanations = {
-        "df": "Shows disk space usage for mounted filesystems",
-        "df -h": "Shows disk space usage in human-readable format (KB, MB, GB)",
-        "free": "Displays memory usage information",
-        "free -h": "Displays memory usage in human-readable format",
-        "ps": "Shows running processes",
-        "ps aux": "Shows all running processes with detailed information",
-        "ls": "Lists files and directories",
-        "ls -la": "Lists all files including hidden ones with detailed information",
-        "top": "Shows real-time process activity",
-        "htop": "Enhanced version of top with better interface",
-        "ping": "Tests network connectivity to a host",
-        "wget": "Downloads files from web servers",
-        "curl": "Transfers data from or to servers",
-        "systemctl": "Controls systemd services",
-        "docker": "Manages Docker containers and images",
-    }
+    The streamed buffer is kept as a plain str and wrapped in a Text
+    object for each refresh, so Rich's markup parser never runs on the
+    (untrusted, per-token) model output — only the static panel title
+    and border use markup. Returns the full accumulated text.
+    """
+    from rich.live import Live
+    from rich.text import Text
+
+    parts: list[str] = []
+    with Live(
+        Panel(Text(""), title=title, border_style=border_style),
+        console=console,
+        refresh_per_second=20,
+    ) as live:
+        async for chunk in chunks:
+            parts.append(chunk)
+            live.update(
+                Panel(Text("".join(parts)), title=title, border_style=border_style)
+            )
+    return "".join(parts)
+
+
+# Offline explanations (fallback when AI is unavailable), built once at
+# import and frozen. Full command strings ("df -h") and bare base
+# commands ("df") live in separate maps so the exact-match lookup can be
+# skipped for single-word commands.
+_EXACT_EXPLANATIONS = MappingProxyType({
+    "df -h": "Shows disk space usage in human-readable format (KB, MB, GB)",
+    "free -h": "Displays memory usage in human-readable format",
+    "ps aux": "Shows all running processes with detailed information",
+    "ls -la": "Lists all files including hidden ones with detailed information",
+})
+
+_BASE_EXPLANATIONS = MappingProxyType({
+    "df": "Shows disk space usage for mounted filesystems",
+    "free": "Displays memory usage information",
+    "ps": "Shows running processes",
+    "ls": "Lists files and directories",
+    "top": "Shows real-time process activity",
+    "htop": "Enhanced version of top with better interface",
+    "ping": "Tests network connectivity to a host",
+    "wget": "Downloads files from web servers",
+    "curl": "Transfers data from or to servers",
+    "systemctl": "Controls systemd services",
+    "docker": "Manages Docker containers and images",
+})
+
+
+def _build_explanation_trie() -> dict:
+    """Build a token trie over the explanation tables at import time.
+
+    Each node maps a command token to a child node; a None key holds the
+    explanation for the prefix ending at that node. Lookup is a single
+    walk over the command's tokens with longest-prefix-wins semantics
+    ("ls -lah" still matches the "ls" entry, "df -h" beats "df").
+    """
+    trie: dict = {}
+    for table in (_BASE_EXPLANATIONS, _EXACT_EXPLANATIONS):
+        for cmd, explanation in table.items():
+            node = trie
+            for token in cmd.split():
+                node = node.setdefault(token, {})
+            node[None] = explanation
+    return trie
+
+
+_EXPLANATION_TRIE = _build_explanation_trie()
+
+
+def _lookup_explanation(command: str) -> Optional[str]:
+    """Longest-prefix explanation lookup via the token trie"""
+    node = _EXPLANATION_TRIE
+    best = None
+    for token in command.split():
+        node = node.get(token)
+        if node is None:
+            break
+        best = node.get(None, best)
+    return best
 
-    # Extract base command
-    base_cmd = command.split()[0]
 
-    explanation = explanations.get(command) or explanations.get(base_cmd)
+def _offline_command_explanation(command: str):
+    """Provide basic offline command explanation"""
+    explanation = _lookup_explanation(command)
 
     if explanation:
         console.print(
@@ -1549,7 +1849,7 @@ def _display_session_context(ctx: CLIContext) -> None:
         f"[bold]Started:[/bold] {ctx.session_start_time.strftime('%Y-%m-%d %H:%M:%S')}\n"
         f"[bold]Commands Processed:[/bold] {ctx.command_count}\n"
         f"[bold]History Length:[/bold] {len(ctx.chat_history)} interactions\n"
-        f"[bold]Session Duration:[/bold] {datetime.now() - ctx.session_start_time}",
+        f"[bold]Session Duration:[/bold] {_session_duration(ctx)}",
         title="Session Information",
         border_style="blue"
     )
@@ -1603,7 +1903,33 @@ def _process_chat_input(user_input: str, ctx: CLIContext, model: Optional[str])
         'timestamp': timestamp,
         'user_input': user_input,
     }
-    
+
+    # Check the execution-plan cache before touching plugins or the LLM.
+    # A hit reconstructs the structured command locally (~ms) instead of
+    # re-running plugin matching and an LLM round trip.
+    plan_key = None
+    if ctx.use_plan_cache and ctx.plan_cache is not None:
+        from ..core.plan_cache import PlanCache
+
+        plan_key = PlanCache.make_key(user_input, ctx.session_context)
+        cached = ctx.plan_cache.get(plan_key)
+        if cached is not None:
+            if ctx.verbose:
+                console.print("[dim]Using cached execution plan[/dim]")
+            history_entry['command_generated'] = cached.command
+            history_entry['plan_cached'] = True
+            _display_command(cached, False, ctx.verbose)
+
+            if _confirm_command_execution():
+                _run(_execute_command(cached, ctx, ctx.verbose))
+                history_entry['executed'] = True
+            else:
+                history_entry['executed'] = False
+                console.print("[yellow]Command execution skipped[/yellow]")
+
+            ctx.chat_history.append(history_entry)
+            return
+
     try:
         with Progress(
             SpinnerColumn(),
@@ -1626,7 +1952,7 @@ def _process_chat_input(user_input: str, ctx: CLIContext, model: Optional[str])
                 "dry_run": False,
             }
 
-            handler_plugin = asyncio.run(
+            handler_plugin = _run(
                 ctx.plugin_manager.find_handler(user_input, plugin_context)
             )
 
@@ -1636,7 +1962,7 @@ def _process_chat_input(user_input: str, ctx: CLIContext, model: Optional[str])
                 # Special handling for LLM plugin - call process_llm_request directly
                 if handler_plugin.metadata.name == "llm" and hasattr(handler_plugin, 'process_llm_request'):
                     try:
-                        ai_response = asyncio.run(handler_plugin.process_llm_request(user_input, plugin_context))
+                        ai_response = _run(handler_plugin.process_llm_request(user_input, plugin_context))
                         history_entry['plugin_used'] = handler_plugin.metadata.name
                         history_entry['ai_response'] = ai_response
 
@@ -1654,7 +1980,7 @@ def _process_chat_input(user_input: str, ctx: CLIContext, model: Optional[str])
 
                 else:
                     # Regular plugin handling for command generation
-                    command = asyncio.run(
+                    command = _run(
                         handler_plugin.generate_command(user_input, plugin_context)
                     )
 
@@ -1663,12 +1989,14 @@ def _process_chat_input(user_input: str, ctx: CLIContext, model: Optional[str])
                         history_entry['command_generated'] = command.command
 
                         # Validate and display command
-                        if asyncio.run(handler_plugin.validate_command(command, plugin_context)):
+                        if _run(handler_plugin.validate_command(command, plugin_context)):
+                            if plan_key is not None and ctx.plan_cache is not None:
+                                ctx.plan_cache.put(plan_key, command)
                             _display_command(command, False, ctx.verbose)
 
                             # Ask for confirmation in chat mode
                             if _confirm_command_execution():
-                                asyncio.run(_execute_command(command, ctx, ctx.verbose))
+                                _run(_execute_command(command, ctx, ctx.verbose))
                                 history_entry['executed'] = True
                             else:
                                 history_entry['executed'] = False
@@ -1715,18 +2043,60 @@ def _build_chat_context(ctx: CLIContext, current_input: str) -> str:
     return "\n".join(context_parts)
 
 
-def _confirm_command_execution() -> bool:
-    """Ask user to confirm command execution in chat mode."""
+def _read_yn() -> bool:
+    """Read a single y/n keypress without a full prompt round-trip.
+
+    Uses raw single-character reads (termios on POSIX, msvcrt on Windows)
+    to skip Rich's per-prompt validation and re-prompt loop. Returns True
+    for 'y' or Enter (default yes), False for anything else or EOF/Ctrl-C.
+    """
+    if sys.platform == "win32":
+        import msvcrt
+
+        try:
+            ch = msvcrt.getch().decode(errors="ignore").lower()
+        except (EOFError, KeyboardInterrupt):
+            return False
+        return ch in ("y", "\r", "\n")
+
+    import termios
+    import tty
+
+    fd = sys.stdin.fileno()
+    old_settings = termios.tcgetattr(fd)
     try:
-        confirm = Prompt.ask(
-            "[yellow]Execute this command?[/yellow]", 
-            choices=["y", "n", "yes", "no"], 
-            default="y",
-            show_choices=False
-        )
-        return confirm.lower() in ["y", "yes"]
+        tty.setcbreak(fd)
+        ch = sys.stdin.read(1).lower()
     except (EOFError, KeyboardInterrupt):
         return False
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+    return ch in ("y", "\r", "\n")
+
+
+def _confirm_command_execution() -> bool:
+    """Ask user to confirm command execution in chat mode."""
+    if not sys.stdin.isatty():
+        # Piped/redirected input: fall back to the line-based prompt
+        try:
+            confirm = Prompt.ask(
+                "[yellow]Execute this command?[/yellow]",
+                choices=["y", "n", "yes", "no"],
+                default="y",
+                show_choices=False,
+            )
+            return confirm.lower() in ["y", "yes"]
+        except (EOFError, KeyboardInterrupt):
+            return False
+
+    console.print("[yellow]Execute this command? [y/n][/yellow] ", end="")
+    try:
+        answer = _read_yn()
+    except Exception:
+        # Terminal doesn't support raw reads (e.g. some CI shells)
+        answer = False
+    console.print("y" if answer else "n")
+    return answer
 
 
 def _fallback_to_ai(context_prompt: str, ctx: CLIContext, history_entry: dict[str, Any], model: Optional[str]) -> None:
@@ -1736,7 +2106,7 @@ def _fallback_to_ai(context_prompt: str, ctx: CLIContext, history_entry: dict[st
         prompt = ctx.langchain.generate_prompt(context_prompt)
         
         # Get AI response
-        response = asyncio.run(ctx.groq_client.chat(prompt, model))
+        response = _run(ctx.groq_client.chat(prompt, model))
         
         if response and response.content:
             history_entry['ai_response'] = response.content
@@ -1753,7 +2123,7 @@ def _fallback_to_ai(context_prompt: str, ctx: CLIContext, history_entry: dict[st
                     _display_command(command, False, ctx.verbose)
                     
                     if _confirm_command_execution():
-                        asyncio.run(_execute_command(command, ctx, ctx.verbose))
+                        _run(_execute_command(command, ctx, ctx.verbose))
                         history_entry['executed'] = True
                     else:
                         history_entry['executed'] = False
@@ -1777,9 +2147,22 @@ def _fallback_to_ai(context_prompt: str, ctx: CLIContext, history_entry: dict[st
         history_entry['ai_error'] = str(e)
 
 
+def _session_duration(ctx: CLIContext) -> timedelta:
+    """Compute elapsed session time from the monotonic clock.
+
+    Monotonic time is immune to wall-clock jumps (NTP adjustments, DST)
+    and cheaper to read than datetime.now(); the datetime start time is
+    kept only for display purposes.
+    """
+    if ctx.session_start_monotonic is not None:
+        elapsed = time.monotonic() - ctx.session_start_monotonic
+        return timedelta(seconds=elapsed)
+    return datetime.now() - ctx.session_start_time
+
+
 def _cleanup_chat_session(ctx: CLIContext, save_history: bool) -> None:
     """Clean up and optionally save chat session."""
-    session_duration = datetime.now() - ctx.session_start_time
+    session_duration = _session_duration(ctx)
     
     # Display session summary
     summary_panel = Panel(
@@ -1801,6 +2184,7 @@ def _cleanup_chat_session(ctx: CLIContext, save_history: bool) -> None:
     ctx.chat_history.clear()
     ctx.session_context = ""
     ctx.session_start_time = None
+    ctx.session_start_monotonic = None
     ctx.command_count = 0
 
 
@@ -20,6 +20,10 @@ from enum import Enum
 from .langchain_integration import DevOpsCommand, CommandType, RiskLevel
 from .os_detection import os_detection
 
+# Risk levels that always force user confirmation (frozenset: O(1)
+# membership instead of scanning a per-call list)
+_CONFIRM_RISK_LEVELS = frozenset({RiskLevel.HIGH, RiskLevel.CRITICAL})
+
 
 class ExecutionStatus(Enum):
     """Status of command execution"""
@@ -172,7 +176,7 @@ class CommandValidator:
     def requires_confirmation(self, command: str, dev_ops_command: DevOpsCommand) -> bool:
         """Check if command requires user confirmation"""
         # High/critical risk always requires confirmation
-        if dev_ops_command.risk_level in [RiskLevel.HIGH, RiskLevel.CRITICAL]:
+        if dev_ops_command.risk_level in _CONFIRM_RISK_LEVELS:
             return True
             
         # Explicitly marked for confirmation
@@ -5,15 +5,148 @@ Provides integration with Groq's free, fast LLM API service.
 Groq offers lightning-fast inference with models like Llama3, Mixtral, and Gemma.
 """
 
+import asyncio
+import functools
+import hashlib
+import json
 import logging
+import string
 from dataclasses import dataclass
-from typing import Any
+from types import MappingProxyType
+from typing import Any, AsyncIterator
 
+import httpx
 from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_groq import ChatGroq
 
 from ..settings import settings
+from .logging_system import EventType, get_logging_system
 from .os_detection import os_detection
+from .response_cache import ResponseCache
+from .semantic_cache import SemanticCache
+
+
+def _tokens(message: Any) -> int | None:
+    """Extract total token count from a chunk/message, or None.
+
+    Reads usage_metadata directly — the old
+    `getattr(r, 'usage', {}).get(...)` form allocated a throwaway dict
+    on every message that lacked the attribute (which is all of them on
+    current langchain-groq; the field is usage_metadata).
+    """
+    usage = getattr(message, "usage_metadata", None)
+    return usage.get("total_tokens") if usage else None
+
+
+# One pooled HTTP client shared by every ChatGroq instance: connections
+# (and their TLS sessions) stay warm across client-cache entries, and
+# HTTP/2 lets concurrent requests multiplex over a single connection.
+_HTTP_ASYNC_CLIENT: httpx.AsyncClient | None = None
+
+
+def _shared_http_client() -> httpx.AsyncClient:
+    """Return the process-wide pooled async HTTP client (built lazily)"""
+    global _HTTP_ASYNC_CLIENT
+    if _HTTP_ASYNC_CLIENT is None or _HTTP_ASYNC_CLIENT.is_closed:
+        limits = httpx.Limits(max_connections=128, max_keepalive_connections=64)
+        timeout = httpx.Timeout(30.0, connect=3.0)
+        try:
+            _HTTP_ASYNC_CLIENT = httpx.AsyncClient(
+                http2=True, limits=limits, timeout=timeout
+            )
+        except ImportError:
+            # http2 support needs the optional h2 package
+            _HTTP_ASYNC_CLIENT = httpx.AsyncClient(limits=limits, timeout=timeout)
+    return _HTTP_ASYNC_CLIENT
+
+
+# Static OS command knowledge base, assembled once at import. Placed
+# first in the message list with byte-identical content on every call
+# so a provider-side prefix/KV cache can serve it at a fraction of the
+# token cost (Groq has no explicit cache_control, so determinism is the
+# whole mechanism). Richer context than the short prompt alone, paid
+# for once instead of per request.
+_OS_KB = {
+    "windows": """Reference — common Windows PowerShell commands:
+- Processes: Get-Process; Stop-Process -Name <name>; Get-Process | Sort-Object CPU -Descending
+- Disk: Get-PSDrive; Get-Volume; Get-ChildItem | Measure-Object -Property Length -Sum
+- Memory: Get-WmiObject Win32_OperatingSystem | Select FreePhysicalMemory
+- Services: Get-Service; Restart-Service <name>; Set-Service <name> -StartupType Automatic
+- Network: Test-NetConnection <host>; Get-NetTCPConnection -State Listen; ipconfig /all
+- Files: Get-ChildItem -Recurse -Filter *.log; Copy-Item; Remove-Item -Confirm
+- Events: Get-EventLog -LogName System -Newest 50""",
+    "unix": """Reference — common Linux/Unix commands:
+- Processes: ps aux; top; htop; kill <pid>; pkill <name>; nice/renice
+- Disk: df -h; du -sh <dir>; lsblk; mount; iostat
+- Memory: free -h; vmstat; cat /proc/meminfo
+- Services: systemctl status|start|stop|restart <svc>; journalctl -u <svc> -n 50
+- Network: ping <host>; ss -tuln; ip addr; curl -I <url>; traceroute <host>
+- Files: ls -la; find / -size +100M; tail -f <file>; grep -r <pattern> <dir>
+- Containers: docker ps; docker logs <id>; docker stats; kubectl get pods""",
+}
+
+
+# Precompiled once at import; substitution is a single pass over the
+# template instead of re-concatenating f-string segments per call
+_SYS_TMPL = string.Template(
+    """You are a DevOps assistant for $OS_UPPER systems.
+
+Operating System: $OS ($VERSION)
+Shell: $SHELL
+Platform: $PLATFORM
+
+CRITICAL: Always provide commands appropriate for $OS:
+- Windows: Use PowerShell commands (Get-Process, Get-WmiObject, Get-ChildItem, etc.)
+- Linux/macOS: Use bash commands (ps, df, ls, etc.)"""
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _os_snapshot():
+    """Memoized OS info — detection runs once per process, not per request"""
+    return os_detection.get_os_info()
+
+
+@functools.lru_cache(maxsize=8)
+def _stable_system_prefix(
+    os_name: str, os_version: str, shell: str, is_windows: bool
+) -> str:
+    """Deterministic system-prompt prefix for a given OS snapshot.
+
+    Memoized so repeat calls return the identical string object, and
+    the bytes never shift between requests — a prerequisite for
+    provider-side prompt-prefix caching.
+    """
+    return _SYS_TMPL.substitute(
+        OS_UPPER=os_name.upper(),
+        OS=os_name,
+        VERSION=os_version,
+        SHELL=shell,
+        PLATFORM="Windows PowerShell" if is_windows else "Unix/Linux Terminal",
+    )
+
+
+# The Groq model catalogue is fixed per release of this CLI, so expose
+# it as an immutable constant instead of rebuilding a list per call
+_AVAILABLE_MODELS = (
+    "llama3-8b-8192",      # Llama 3 8B (fastest)
+    "llama3-70b-8192",     # Llama 3 70B (most capable)
+    "mixtral-8x7b-32768",  # Mixtral 8x7B (good balance)
+    "gemma-7b-it",         # Google Gemma 7B
+    "gemma2-9b-it",        # Google Gemma 2 9B
+)
+
+# Static model description shared by every get_model_info() call; only
+# the connection flag changes at runtime
+_STATIC_MODEL_INFO = MappingProxyType(
+    {
+        "provider": "groq",
+        "model": settings.groq_model,
+        "max_tokens": settings.max_tokens,
+        "temperature": settings.temperature,
+        "api_key_configured": bool(settings.groq_api_key),
+    }
+)
 
 
 @dataclass
@@ -34,11 +167,83 @@ class GroqClient:
     Perfect for development and production use cases.
     """
     
+    # Bound on the in-process exact-match response cache
+    _RESPONSE_CACHE_MAX = 1024
+
     def __init__(self) -> None:
         self.logger = logging.getLogger(__name__)
         self._client: ChatGroq | None = None
         self._connected = False
-    
+        # Exact-match response cache: identical request parameters skip
+        # the network entirely (µs dict lookup vs seconds of API latency)
+        self._response_cache: dict[str, GroqResponse] = {}
+        # Semantic cache catches paraphrased repeats of earlier prompts
+        # (no-op unless the optional fastembed extra is installed)
+        self._semantic_cache = SemanticCache()
+        # Disk cache persists responses across CLI invocations (same
+        # key as the exact-match cache, backed by SQLite in ~/.chatops)
+        self._disk_cache = ResponseCache()
+        # Warm ChatGroq instances keyed by (model, temperature,
+        # max_tokens); rebuilding one per override re-ran Pydantic
+        # validation and tore down the HTTP connection pool every call
+        self._client_cache: dict[tuple[str, float, int], ChatGroq] = {}
+        self._client_lock = asyncio.Lock()
+        # Micro-batching coalescer state (started lazily on first use)
+        self._batch_queue: asyncio.Queue | None = None
+        self._batch_task: asyncio.Task | None = None
+        # LLM event logging runs on a background drain task so audit
+        # writes never sit on the request latency path
+        self._log_queue: asyncio.Queue | None = None
+        self._log_task: asyncio.Task | None = None
+
+    def _log_event(self, **fields: Any) -> None:
+        """Queue an LLM log event for asynchronous writing"""
+        if self._log_queue is None:
+            self._log_queue = asyncio.Queue()
+            self._log_task = asyncio.create_task(self._log_drain())
+        self._log_queue.put_nowait(fields)
+
+    async def _log_drain(self) -> None:
+        """Drain queued log events into the logging system"""
+        while True:
+            fields = await self._log_queue.get()
+            try:
+                await get_logging_system().log_llm_event(**fields)
+            except Exception as e:
+                self.logger.error(f"Failed to log LLM event: {e}")
+
+    @staticmethod
+    def _cache_key(
+        prompt: str,
+        system_prompt: str | None,
+        model: str | None,
+        max_tokens: int | None,
+        temperature: float | None,
+    ) -> str:
+        """Fingerprint of everything that influences a response"""
+        os_info = _os_snapshot()
+        raw = "\x00".join(
+            (
+                model or settings.groq_model,
+                str(temperature if temperature is not None else settings.temperature),
+                str(max_tokens or settings.max_tokens),
+                system_prompt or "",
+                prompt,
+                os_info.name,
+            )
+        )
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def _store_exact(self, cache_key: str, result: GroqResponse) -> None:
+        """Insert into the exact-match tier, evicting the oldest entry.
+
+        Also used to promote hits from the slower tiers (semantic,
+        disk) so repeats of the same request resolve at dict speed.
+        """
+        if len(self._response_cache) >= self._RESPONSE_CACHE_MAX:
+            self._response_cache.pop(next(iter(self._response_cache)))
+        self._response_cache[cache_key] = result
+
     async def connect(self) -> bool:
         """Initialize connection to Groq API"""
         try:
@@ -46,33 +251,149 @@ class GroqClient:
                 self.logger.error("GROQ_API_KEY not found in environment variables")
                 return False
             
-            self._client = ChatGroq(
-                api_key=settings.groq_api_key,
-                model=settings.groq_model,
-                temperature=settings.temperature,
-                max_tokens=settings.max_tokens,
-            )
-            
-            # Test the connection with a simple query
-            test_response = await self._client.ainvoke([
-                HumanMessage(content="Hello")
-            ])
-            
-            if test_response:
-                self._connected = True
-                self.logger.info(
-                    f"Connected to Groq API with model: {settings.groq_model}"
+            self._client = await self._resolve_client()
+
+            # Optional auth check: a models-list GET costs no tokens,
+            # unlike the old "Hello" completion probe which added a full
+            # LLM round trip to every cold start. By default we trust
+            # construction and let the first real call surface auth
+            # errors (its error handling already covers that).
+            if getattr(settings, "groq_validate_on_connect", False):
+                probe = await _shared_http_client().get(
+                    "https://api.groq.com/openai/v1/models",
+                    headers={"Authorization": f"Bearer {settings.groq_api_key}"},
                 )
-                return True
-            else:
-                self.logger.error("Failed to get response from Groq API")
-                return False
-                
+                if probe.status_code != 200:
+                    self.logger.error(
+                        f"Groq API auth check failed: HTTP {probe.status_code}"
+                    )
+                    return False
+
+            self._connected = True
+            self.logger.info(
+                f"Connected to Groq API with model: {settings.groq_model}"
+            )
+            return True
+
         except Exception as e:
             self.logger.error(f"Failed to connect to Groq API: {e}")
             self._connected = False
             return False
     
+    async def _resolve_client(
+        self,
+        model: str | None = None,
+        max_tokens: int | None = None,
+        temperature: float | None = None,
+    ) -> ChatGroq:
+        """Return a warm ChatGroq instance for the given settings.
+
+        Instances are memoized per (model, temperature, max_tokens) so
+        every request — default or override — reuses a live connection
+        pool, and client state is never mutated between calls. The lock
+        guards only cache insertion, never the network call.
+        """
+        key = (
+            model or settings.groq_model,
+            temperature if temperature is not None else settings.temperature,
+            max_tokens or settings.max_tokens,
+        )
+        client = self._client_cache.get(key)
+        if client is None:
+            async with self._client_lock:
+                client = self._client_cache.get(key)
+                if client is None:
+                    client = ChatGroq(
+                        api_key=settings.groq_api_key,
+                        model=key[0],
+                        temperature=key[1],
+                        max_tokens=key[2],
+                        http_async_client=_shared_http_client(),
+                    )
+                    self._client_cache[key] = client
+        return client
+
+    def _build_messages(
+        self, prompt: str, system_prompt: str | None = None
+    ) -> list:
+        """Build the OS-aware message list shared by all generation paths.
+
+        The OS facts go first as a byte-identical cached prefix so any
+        provider-side prompt-prefix/KV cache can hit; only the tail
+        system message and user prompt vary per call.
+        """
+        os_info = _os_snapshot()
+        knowledge = _OS_KB["windows" if os_info.is_windows else "unix"]
+        prefix = _stable_system_prefix(
+            os_info.name, os_info.version, os_info.shell, os_info.is_windows
+        )
+        tail = (
+            system_prompt
+            if system_prompt
+            else "Generate appropriate shell commands for the detected OS."
+        )
+
+        return [
+            SystemMessage(content=knowledge),
+            SystemMessage(content=prefix),
+            SystemMessage(content=tail),
+            HumanMessage(content=prompt),
+        ]
+
+    async def generate_response_stream(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        model: str | None = None,
+        max_tokens: int | None = None,
+        temperature: float | None = None,
+    ) -> AsyncIterator[str]:
+        """
+        Stream a response from Groq, yielding text chunks as they arrive.
+
+        Callers start rendering on the first token instead of waiting for
+        the full completion, so user-perceived latency is time-to-first-
+        token rather than time-to-last-token.
+
+        Args:
+            prompt: User prompt/question
+            system_prompt: Optional system prompt for context
+            model: Override default model
+            max_tokens: Override default max tokens
+            temperature: Override default temperature
+
+        Yields:
+            Text chunks of the response content
+        """
+        if not self._connected or not self._client:
+            if not await self.connect():
+                raise ConnectionError("Not connected to Groq API")
+
+        messages = self._build_messages(prompt, system_prompt)
+
+        client = await self._resolve_client(model, max_tokens, temperature)
+
+        async for chunk in client.astream(messages):
+            if chunk.content:
+                yield chunk.content
+
+    async def _stream_collect(
+        self, client: ChatGroq, messages: list
+    ) -> tuple[str, int | None]:
+        """Drain a streamed completion into (content, total_tokens).
+
+        Streaming is the single transport for all generation: buffered
+        callers just collect the chunks here, and the usage metadata
+        that arrives on the final chunk is captured in the same pass.
+        """
+        parts: list[str] = []
+        tokens: int | None = None
+        async for chunk in client.astream(messages):
+            if chunk.content:
+                parts.append(chunk.content)
+            tokens = _tokens(chunk) or tokens
+        return "".join(parts), tokens
+
     async def generate_response(
         self,
         prompt: str,
@@ -94,6 +415,46 @@ class GroqClient:
         Returns:
             GroqResponse with generated content
         """
+        # Tiered lookup, cheapest first, each hit promoted into the
+        # tiers above it so the next identical request hits earlier:
+        #   1. exact hash (µs dict read)
+        #   2. semantic match (sub-ms vector product)
+        #   3. disk (ms SQLite read, survives restarts)
+        #   4. live API call (seconds)
+        cache_key = self._cache_key(
+            prompt, system_prompt, model, max_tokens, temperature
+        )
+        cached = self._response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Scope includes the system prompt: the same client serves ask
+        # (strict JSON output), chat (per-turn context), and explain, so
+        # a near-identical prompt under a different instruction must not
+        # reuse the other's answer
+        scope = "\x00".join(
+            (
+                model or settings.groq_model,
+                _os_snapshot().name,
+                hashlib.sha256((system_prompt or "").encode()).hexdigest()[:16],
+            )
+        )
+        semantic_hit = self._semantic_cache.get(prompt, scope)
+        if semantic_hit is not None:
+            self._store_exact(cache_key, semantic_hit)
+            return semantic_hit
+
+        disk_hit = self._disk_cache.get(cache_key)
+        if disk_hit is not None:
+            result = GroqResponse(
+                content=disk_hit[0],
+                success=True,
+                model=disk_hit[1],
+                tokens_used=disk_hit[2],
+            )
+            self._store_exact(cache_key, result)
+            return result
+
         if not self._connected or not self._client:
             if not await self.connect():
                 return GroqResponse(
@@ -101,78 +462,65 @@ class GroqClient:
                     success=False,
                     error="Not connected to Groq API"
                 )
-        
+
         try:
-            # Prepare messages with OS-aware system prompt
-            messages = []
-            
-            # Enhanced system prompt with OS information
-            os_info = os_detection.get_os_info()
-            enhanced_system_prompt = f"""You are a DevOps assistant for {os_info.name.upper()} systems.
+            messages = self._build_messages(prompt, system_prompt)
 
-Operating System: {os_info.name} ({os_info.version})
-Shell: {os_info.shell}
-Platform: {"Windows PowerShell" if os_info.is_windows else "Unix/Linux Terminal"}
+            # Pick a warm client for the requested settings instead of
+            # rebuilding (and never mutate self._client — overrides from
+            # one concurrent call must not leak into another's request)
+            client = await self._resolve_client(model, max_tokens, temperature)
 
-CRITICAL: Always provide commands appropriate for {os_info.name}:
-- Windows: Use PowerShell commands (Get-Process, Get-WmiObject, Get-ChildItem, etc.)
-- Linux/macOS: Use bash commands (ps, df, ls, etc.)
+            # Generate response (streamed under the hood; buffered here)
+            content, tokens_used = await self._stream_collect(client, messages)
 
-{system_prompt if system_prompt else "Generate appropriate shell commands for the detected OS."}"""
+            # Log LLM event (queued; written off the hot path)
+            self._log_event(
+                event_type=EventType.LLM_RESPONSE,
+                provider="groq",
+                model=model or settings.groq_model,
+                message="Response generated successfully",
+                success=True,
+                token_count=tokens_used,
+            )
 
-            messages.append(SystemMessage(content=enhanced_system_prompt))
-            messages.append(HumanMessage(content=prompt))
-            
-            # Update client settings if overrides provided
-            if model or max_tokens or temperature:
-                self._client = ChatGroq(
-                    api_key=settings.groq_api_key,
-                    model=model or settings.groq_model,
-                    temperature=temperature or settings.temperature,
-                    max_tokens=max_tokens or settings.max_tokens,
-                )
-            
-            # Generate response
-            response = await self._client.ainvoke(messages)
-            
-            # Log LLM event
-            try:
-                from .logging_system import get_logging_system, EventType
-                logging_system = get_logging_system()
-                logging_system.log_llm_event(
-                    event_type=EventType.LLM_RESPONSE,
-                    provider="groq",
-                    model=model or settings.groq_model,
-                    message="Response generated successfully",
-                    success=True,
-                    token_count=getattr(response, 'usage', {}).get('total_tokens')
-                )
-            except Exception as log_error:
-                self.logger.error(f"Failed to log LLM event: {log_error}")
-            
-            return GroqResponse(
-                content=response.content,
+            result = GroqResponse(
+                content=content,
                 success=True,
                 model=model or settings.groq_model,
-                tokens_used=getattr(response, 'usage', {}).get('total_tokens')
+                tokens_used=tokens_used
             )
-            
+
+            # A live result feeds every tier so any future lookup form
+            # (identical, paraphrased, or cross-run) can hit
+            self._store_exact(cache_key, result)
+
+            # The semantic and disk tiers only keep reproducible output:
+            # high-temperature sampling isn't deterministic, so replaying
+            # one frozen answer for a paraphrase or across runs would be
+            # misleading
+            effective_temperature = (
+                temperature if temperature is not None else settings.temperature
+            )
+            if effective_temperature <= 0.2:
+                self._semantic_cache.put(prompt, scope, result)
+                self._disk_cache.put(
+                    cache_key, content, result.model, tokens_used
+                )
+
+            return result
+
         except Exception as e:
             self.logger.error(f"Groq API request failed: {e}")
             
-            # Log LLM error
-            try:
-                from .logging_system import get_logging_system, EventType
-                logging_system = get_logging_system()
-                logging_system.log_llm_event(
-                    event_type=EventType.LLM_RESPONSE,
-                    provider="groq",
-                    model=model or settings.groq_model,
-                    message=f"Error generating response: {str(e)}",
-                    success=False
-                )
-            except Exception as log_error:
-                self.logger.error(f"Failed to log LLM error: {log_error}")
+            # Log LLM error (queued; written off the hot path)
+            self._log_event(
+                event_type=EventType.LLM_RESPONSE,
+                provider="groq",
+                model=model or settings.groq_model,
+                message=f"Error generating response: {str(e)}",
+                success=False,
+            )
             
             return GroqResponse(
                 content="",
@@ -180,30 +528,230 @@ CRITICAL: Always provide commands appropriate for {os_info.name}:
                 error=str(e)
             )
     
+    # Upper bound on in-flight requests in generate_many; Groq handles
+    # high parallelism, but unbounded fan-out trips per-minute limits
+    _DEFAULT_MAX_CONCURRENCY = 32
+
+    async def generate_many(
+        self,
+        prompts: list[str],
+        system_prompt: str | None = None,
+        max_concurrency: int | None = None,
+    ) -> list[GroqResponse]:
+        """
+        Generate responses for several prompts in parallel.
+
+        Requests run concurrently under a semaphore so K prompts cost
+        roughly ceil(K/N) round trips instead of K sequential ones,
+        without stampeding the API's rate limits.
+
+        Args:
+            prompts: Prompts to answer, in order
+            system_prompt: Optional shared system prompt
+            max_concurrency: Override the in-flight request cap
+
+        Returns:
+            GroqResponses in the same order as the prompts
+        """
+        limit = max_concurrency or int(
+            getattr(settings, "groq_max_concurrency", 0)
+            or self._DEFAULT_MAX_CONCURRENCY
+        )
+        semaphore = asyncio.Semaphore(limit)
+
+        async def _one(prompt: str) -> GroqResponse:
+            async with semaphore:
+                # Route through the coalescer: prompts landing within
+                # the batching window share one API round trip
+                return await self.generate_response_batched(prompt, system_prompt)
+
+        return await asyncio.gather(*(_one(prompt) for prompt in prompts))
+
+    # Micro-batching: coalesce prompts arriving within a short window
+    # into one marshaled API call. Capped at 8 rows — latency grows with
+    # marshaled input length, so bigger batches stop paying off.
+    _BATCH_MAX = 8
+    _BATCH_WINDOW_SECONDS = 0.02
+
+    async def generate_response_batched(
+        self, prompt: str, system_prompt: str | None = None
+    ) -> GroqResponse:
+        """
+        Generate a response through the micro-batching coalescer.
+
+        Prompts submitted concurrently within the batching window share
+        one API round trip: they are marshaled into a single numbered
+        prompt and the JSON-array answer is demultiplexed back to each
+        caller's future. A lone prompt falls through to the normal
+        single-shot path with no extra latency beyond the window. Only
+        prompts with the same system_prompt are coalesced together;
+        generate_many routes through here, so its fan-outs batch
+        naturally.
+        """
+        if self._batch_queue is None:
+            self._batch_queue = asyncio.Queue()
+        if self._batch_task is None or self._batch_task.done():
+            self._batch_task = asyncio.create_task(self._batcher_loop())
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._batch_queue.put_nowait((prompt, system_prompt, future))
+        return await future
+
+    @staticmethod
+    def _deliver(
+        future: asyncio.Future,
+        result: GroqResponse | None = None,
+        error: Exception | None = None,
+    ) -> None:
+        """Resolve a caller's future unless it is already done.
+
+        Callers can be cancelled (Ctrl+C, wait_for timeouts, gather
+        siblings) while their entry sits in the queue; setting a result
+        on a cancelled future raises InvalidStateError, which would
+        kill the batcher task and strand every later caller.
+        """
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    async def _batcher_loop(self) -> None:
+        """Drain the batch queue: collect up to _BATCH_MAX prompts per window.
+
+        A batch only accepts entries sharing the first entry's system
+        prompt — mixed instructions cannot be marshaled into one call
+        without cross-contaminating answers. A mismatched entry is held
+        back to seed the next batch.
+        """
+        loop = asyncio.get_running_loop()
+        held_back = None
+        while True:
+            batch: list = []
+            try:
+                first = (
+                    held_back
+                    if held_back is not None
+                    else await self._batch_queue.get()
+                )
+                held_back = None
+                batch.append(first)
+                deadline = loop.time() + self._BATCH_WINDOW_SECONDS
+                while len(batch) < self._BATCH_MAX:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        entry = await asyncio.wait_for(
+                            self._batch_queue.get(), remaining
+                        )
+                    except asyncio.TimeoutError:
+                        break
+                    if entry[1] != first[1]:
+                        held_back = entry
+                        break
+                    batch.append(entry)
+
+                if len(batch) == 1:
+                    prompt, system_prompt, future = batch[0]
+                    try:
+                        result = await self.generate_response(prompt, system_prompt)
+                    except Exception as e:
+                        self._deliver(future, error=e)
+                    else:
+                        self._deliver(future, result)
+                    continue
+
+                await self._dispatch_batch(batch)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # The drain loop must survive anything short of
+                # cancellation: fail the batch's callers, not the task
+                self.logger.error(f"Batch loop error: {e}")
+                for _, _, future in batch:
+                    self._deliver(future, error=e)
+
+    async def _dispatch_batch(self, batch: list) -> None:
+        """Send one marshaled call and demultiplex answers to futures"""
+        numbered = "\n".join(
+            f"{i}) {prompt}" for i, (prompt, _, _) in enumerate(batch, start=1)
+        )
+        instruction = (
+            "Answer each numbered query independently. Return ONLY a JSON "
+            "array of strings with exactly one element per query, in order."
+        )
+        # All entries share one system prompt (the loop guarantees it);
+        # keep it so batched answers match what single calls would say
+        shared_system = batch[0][1]
+        if shared_system:
+            instruction = f"{shared_system}\n\n{instruction}"
+
+        response = await self.generate_response(numbered, system_prompt=instruction)
+
+        if response.success:
+            try:
+                text = response.content
+                start, end = text.find("["), text.rfind("]")
+                answers = json.loads(text[start : end + 1])
+                if isinstance(answers, list) and len(answers) == len(batch):
+                    for (_, _, future), answer in zip(batch, answers):
+                        self._deliver(
+                            future,
+                            GroqResponse(
+                                content=str(answer),
+                                success=True,
+                                model=response.model,
+                            ),
+                        )
+                    return
+            except (ValueError, TypeError):
+                self.logger.warning(
+                    "Batched response could not be demultiplexed; retrying individually"
+                )
+
+        # Marshaling failed — fall back to one call per prompt
+        for prompt, system_prompt, future in batch:
+            if future.done():
+                continue
+            try:
+                result = await self.generate_response(prompt, system_prompt)
+            except Exception as e:
+                self._deliver(future, error=e)
+            else:
+                self._deliver(future, result)
+
+    async def close(self) -> None:
+        """Cancel background tasks and observe any errors they died with"""
+        for task in (self._batch_task, self._log_task):
+            if task is None:
+                continue
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            except Exception as e:
+                self.logger.error(f"Background task ended with error: {e}")
+        self._batch_task = None
+        self._batch_queue = None
+        self._log_task = None
+        self._log_queue = None
+
     def is_connected(self) -> bool:
         """Check if client is connected to Groq API"""
         return self._connected
     
     def get_model_info(self) -> dict[str, Any]:
         """Get information about the current model"""
-        return {
-            "provider": "groq",
-            "model": settings.groq_model,
-            "max_tokens": settings.max_tokens,
-            "temperature": settings.temperature,
-            "api_key_configured": bool(settings.groq_api_key),
-            "connected": self._connected,
-        }
-    
+        # The static fields are shared and immutable; only the
+        # connection flag varies per call
+        return {**_STATIC_MODEL_INFO, "connected": self._connected}
+
     def list_available_models(self) -> list[str]:
         """List available Groq models"""
-        return [
-            "llama3-8b-8192",      # Llama 3 8B (fastest)
-            "llama3-70b-8192",     # Llama 3 70B (most capable)
-            "mixtral-8x7b-32768",  # Mixtral 8x7B (good balance)
-            "gemma-7b-it",         # Google Gemma 7B
-            "gemma2-9b-it",        # Google Gemma 2 9B
-        ]
+        return list(_AVAILABLE_MODELS)
     
     async def test_connection(self) -> bool:
         """Test connection to Groq API"""
@@ -5,18 +5,40 @@ This module provides LangChain components for natural language processing,
 prompt engineering, and structured output parsing for DevOps commands.
 """
 
+import functools
 import json
 import logging
 import re
-from typing import Dict, List, Optional, Union, Any, Tuple
-from dataclasses import dataclass
+from typing import Dict, List
+from dataclasses import dataclass, field, replace
 from enum import Enum
-
-from langchain_core.prompts import PromptTemplate, ChatPromptTemplate
-from langchain_core.output_parsers import BaseOutputParser, PydanticOutputParser
-from langchain_core.exceptions import OutputParserException
-from pydantic import BaseModel, Field, validator
-import yaml
+from types import MappingProxyType
+
+# The only langchain-core import left is the parser base class, which is
+# needed at class-definition time and so cannot move behind a function.
+# Everything else heavy (yaml, pydantic, the prompts machinery) is gone,
+# trimming CLI cold-start for commands that import this module
+# transitively.
+from langchain_core.output_parsers import BaseOutputParser
+
+# Use orjson's Rust decoder when installed (the `speed` extra); LLM
+# responses are decoded on every turn and it is several times faster
+# than the stdlib parser.
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# Compiled once at import: the fallback parser runs these on every
+# unstructured LLM response
+_CMD_PATTERNS = [
+    re.compile(r"`([^`]+)`"),  # Code blocks
+    re.compile(r'"([^"]+)"'),  # Quoted text
+    re.compile(r"'([^']+)'"),  # Single quoted
+    re.compile(r"^(\S+.*?)(?:\n|$)"),  # First line
+]
 
 
 class CommandType(Enum):
@@ -43,9 +65,129 @@ class RiskLevel(Enum):
     CRITICAL = "critical"  # Irreversible or system-critical changes
 
 
-@dataclass
+# Keyword sets used to classify commands, hoisted to module scope so the
+# classifier regex below can be built once at import
+_CLASSIFICATION_KEYWORDS = {
+    CommandType.SYSTEM_INFO: (
+        "df", "free", "top", "ps", "uname", "whoami", "id", "uptime", "lscpu",
+    ),
+    CommandType.PROCESS_MANAGEMENT: (
+        "kill", "killall", "pkill", "nohup", "jobs", "bg", "fg",
+    ),
+    CommandType.FILE_OPERATIONS: (
+        "ls", "cp", "mv", "rm", "chmod", "chown", "find", "grep", "cat",
+        "tail", "head",
+    ),
+    CommandType.NETWORK: (
+        "ping", "curl", "wget", "netstat", "ss", "iptables", "ufw",
+    ),
+    CommandType.DOCKER: ("docker", "docker-compose", "podman"),
+    CommandType.SERVICE_MANAGEMENT: (
+        "systemctl", "service", "nginx", "apache2", "mysql", "postgres",
+    ),
+    CommandType.MONITORING: ("htop", "iotop", "watch", "vmstat", "iostat"),
+    CommandType.SECURITY: ("sudo", "su", "passwd", "chroot", "selinux"),
+}
+
+# One combined alternation with a named group per command type: a single
+# C-level scan replaces ~60 Python substring checks, and the word
+# boundaries stop keywords matching inside unrelated words ("df" no
+# longer fires on "asdf"). Group names mirror CommandType values so the
+# winning group maps straight back to the enum.
+_CLASSIFIER_RE = re.compile(
+    "|".join(
+        rf"\b(?P<{cmd_type.value}>{'|'.join(map(re.escape, keywords))})\b"
+        for cmd_type, keywords in _CLASSIFICATION_KEYWORDS.items()
+    ),
+    re.IGNORECASE,
+)
+
+# Risk patterns in severity order (first match wins); these keep
+# substring semantics because several include trailing spaces or flags
+_RISK_PATTERNS = {
+    RiskLevel.CRITICAL: ("rm -rf /", "dd if=", "mkfs", "fdisk", "parted"),
+    RiskLevel.HIGH: ("rm -rf", "rm -r", "kill -9", "shutdown", "reboot", "halt"),
+    RiskLevel.MEDIUM: (
+        "rm ", "mv ", "chmod", "chown", "systemctl stop", "systemctl restart",
+    ),
+    RiskLevel.LOW: ("cp ", "mkdir", "touch", "echo", "systemctl status"),
+    RiskLevel.SAFE: ("ls", "cat", "grep", "find", "ps", "top", "df", "free", "uname"),
+}
+
+# All risk levels folded into one regex, one named group per level.
+# Alternation order follows severity, so at any position the gravest
+# pattern wins ("rm -rf /" is tried before "rm -rf" before "rm ").
+_RISK_RE = re.compile(
+    "|".join(
+        rf"(?P<{level.value}>{'|'.join(map(re.escape, patterns))})"
+        for level, patterns in _RISK_PATTERNS.items()
+    ),
+    re.IGNORECASE,
+)
+
+# Lower rank = more severe; used to pick the gravest match in a string
+_RISK_RANK = {level.value: rank for rank, level in enumerate(_RISK_PATTERNS)}
+
+# Commands that typically need elevated privileges
+_SUDO_KEYWORDS = frozenset(
+    (
+        "systemctl", "service", "apt", "yum", "dnf", "pacman",
+        "mount", "umount", "iptables", "ufw", "nginx", "apache2",
+    )
+)
+
+_SUDO_RE = re.compile(
+    rf"\b(?:{'|'.join(sorted(_SUDO_KEYWORDS))})\b", re.IGNORECASE
+)
+
+
+def _scan_command(command: str) -> tuple[CommandType, RiskLevel, bool]:
+    """Derive (type, risk, sudo) from a command in one pass per facet.
+
+    Each facet runs as one case-insensitive compiled C-level scan over
+    the original string — no .lower() copy — replacing the previous
+    trio of independent Python keyword loops.
+    """
+    type_match = _CLASSIFIER_RE.search(command)
+    command_type = (
+        CommandType(type_match.lastgroup) if type_match else CommandType.UNKNOWN
+    )
+
+    # Single pass over the string; keep the most severe group seen
+    best: str | None = None
+    for match in _RISK_RE.finditer(command):
+        group = match.lastgroup
+        if best is None or _RISK_RANK[group] < _RISK_RANK[best]:
+            best = group
+            if _RISK_RANK[best] == 0:  # Critical — nothing outranks it
+                break
+    risk_level = RiskLevel(best) if best else RiskLevel.MEDIUM
+
+    return command_type, risk_level, _sudo_check(command)
+
+
+def _sudo_check(command: str) -> bool:
+    """One-shot sudo test.
+
+    Whole-word keywords resolve via one O(tokens) set intersection on
+    the original string (commands are almost always lowercase); the
+    case-insensitive alternation catches mixed-case and prefixed forms
+    the token check can't see (e.g. "apt" inside "apt-get").
+    """
+    if set(command.split()) & _SUDO_KEYWORDS:
+        return True
+    return _SUDO_RE.search(command) is not None
+
+
+@dataclass(slots=True)
 class DevOpsCommand:
-    """Structured representation of a DevOps command"""
+    """Structured representation of a DevOps command.
+
+    Slots halve per-instance memory and speed attribute access —
+    instances are created for every parsed response and retained in
+    caches and history. Not frozen: plugins escalate risk_level in
+    place.
+    """
 
     command: str
     description: str
@@ -54,278 +196,141 @@ class DevOpsCommand:
     requires_sudo: bool = False
     requires_confirmation: bool = False
     estimated_duration: str = "< 1 second"
-    prerequisites: List[str] = None
-    alternative_commands: List[str] = None
+    prerequisites: List[str] = field(default_factory=list)
+    alternative_commands: List[str] = field(default_factory=list)
 
-    def __post_init__(self):
-        if self.prerequisites is None:
-            self.prerequisites = []
-        if self.alternative_commands is None:
-            self.alternative_commands = []
 
+# Valid enum value sets for normalizing LLM output, precomputed once
+_VALID_TYPES = frozenset(ct.value for ct in CommandType)
+_VALID_RISKS = frozenset(rl.value for rl in RiskLevel)
 
-class DevOpsCommandModel(BaseModel):
-    """Pydantic model for structured command output"""
+# Risk levels that demand user confirmation before execution
+_CONFIRM_RISKS = frozenset({RiskLevel.HIGH, RiskLevel.CRITICAL})
 
-    command: str = Field(description="The shell command to execute")
-    description: str = Field(description="Brief description of what the command does")
-    command_type: str = Field(
-        description="Type of command (system_info, process_management, etc.)"
-    )
-    risk_level: str = Field(description="Risk level: safe, low, medium, high, critical")
-    requires_sudo: bool = Field(
-        default=False, description="Whether the command requires sudo privileges"
-    )
-    requires_confirmation: bool = Field(
-        default=False, description="Whether to ask for user confirmation"
-    )
-    estimated_duration: str = Field(
-        default="< 1 second", description="Estimated execution time"
-    )
-    prerequisites: List[str] = Field(
-        default_factory=list, description="Required tools or conditions"
+
+def _command_from_dict(data: dict) -> DevOpsCommand:
+    """Build a DevOpsCommand from decoded LLM output.
+
+    Clamps the two enum-valued fields against the precomputed value
+    sets and applies field defaults in one place — the whole conversion
+    is a handful of dict lookups, with no model-framework overhead.
+    Missing command/description raise KeyError, which callers treat as
+    a parse failure.
+    """
+    command_type = data.get("command_type", "unknown")
+    if command_type not in _VALID_TYPES:
+        command_type = CommandType.UNKNOWN.value
+    risk_level = data.get("risk_level", "medium")
+    if risk_level not in _VALID_RISKS:
+        risk_level = RiskLevel.MEDIUM.value
+
+    return DevOpsCommand(
+        command=data["command"],
+        description=data["description"],
+        command_type=CommandType(command_type),
+        risk_level=RiskLevel(risk_level),
+        requires_sudo=bool(data.get("requires_sudo", False)),
+        requires_confirmation=bool(data.get("requires_confirmation", False)),
+        estimated_duration=data.get("estimated_duration", "< 1 second"),
+        prerequisites=data.get("prerequisites") or [],
+        alternative_commands=data.get("alternative_commands") or [],
     )
-    alternative_commands: List[str] = Field(
-        default_factory=list, description="Alternative ways to achieve the same result"
+
+
+def _parse_simple_text(text: str) -> DevOpsCommand:
+    """Fallback parser for simple command text (already stripped)"""
+    # Extract command from common patterns, stopping at the first hit
+    command = text
+    for pattern in _CMD_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            command = match.group(1).strip()
+            break
+
+    # One shared scan derives type, risk, and sudo together
+    command_type, risk_level, requires_sudo = _scan_command(command)
+
+    return DevOpsCommand(
+        command=command,
+        description=f"Execute: {command}",
+        command_type=command_type,
+        risk_level=risk_level,
+        requires_sudo=requires_sudo,
+        requires_confirmation=risk_level in _CONFIRM_RISKS,
     )
 
-    @validator("command_type")
-    def validate_command_type(cls, v):
-        valid_types = [ct.value for ct in CommandType]
-        if v not in valid_types:
-            return CommandType.UNKNOWN.value
-        return v
 
-    @validator("risk_level")
-    def validate_risk_level(cls, v):
-        valid_levels = [rl.value for rl in RiskLevel]
-        if v not in valid_levels:
-            return RiskLevel.MEDIUM.value
-        return v
+# Module-level so the cache is keyed on the text alone: the parser is a
+# pydantic model (unhashable), so it cannot be part of an lru_cache key
+@functools.lru_cache(maxsize=512)
+def _parse_cached(text: str) -> DevOpsCommand:
+    """Uncopied parse body backing the memoized DevOpsOutputParser.parse"""
+    # Strip once; every branch below (JSON check, brace scan,
+    # simple-command fallback) reuses the same copy
+    stripped = text.strip()
+    try:
+        # Try to parse as JSON first
+        if stripped.startswith("{"):
+            data = _loads(stripped)
+        else:
+            # Extract the outermost brace span with two C-level
+            # scans; the old r"\{.*\}" DOTALL regex backtracked
+            # over the whole tail to find the same slice
+            start = stripped.find("{")
+            end = stripped.rfind("}")
+            if start >= 0 and end > start:
+                data = _loads(stripped[start : end + 1])
+            else:
+                # Fallback: parse as simple command
+                return _parse_simple_text(stripped)
+
+        return _command_from_dict(data)
+
+    except Exception as e:
+        logging.warning(f"Failed to parse structured output: {e}")
+        return _parse_simple_text(stripped)
 
 
 class DevOpsOutputParser(BaseOutputParser[DevOpsCommand]):
     """Custom output parser for DevOps commands"""
 
     def parse(self, text: str) -> DevOpsCommand:
-        """Parse LLM output into DevOpsCommand object"""
-        try:
-            # Try to parse as JSON first
-            if text.strip().startswith("{"):
-                data = json.loads(text.strip())
-            else:
-                # Try to extract JSON from text
-                json_match = re.search(r"\{.*\}", text, re.DOTALL)
-                if json_match:
-                    data = json.loads(json_match.group())
-                else:
-                    # Fallback: parse as simple command
-                    return self._parse_simple_command(text)
-
-            # Validate with Pydantic model
-            model = DevOpsCommandModel(**data)
-
-            return DevOpsCommand(
-                command=model.command,
-                description=model.description,
-                command_type=CommandType(model.command_type),
-                risk_level=RiskLevel(model.risk_level),
-                requires_sudo=model.requires_sudo,
-                requires_confirmation=model.requires_confirmation,
-                estimated_duration=model.estimated_duration,
-                prerequisites=model.prerequisites,
-                alternative_commands=model.alternative_commands,
-            )
+        """Parse LLM output into DevOpsCommand object.
 
-        except Exception as e:
-            logging.warning(f"Failed to parse structured output: {e}")
-            return self._parse_simple_command(text)
+        Results are memoized on the raw text — identical LLM responses
+        (common with cached model output) skip JSON decoding, validation
+        and regex classification entirely. Callers receive a fresh copy
+        because downstream code (plugins, executor) mutates commands.
+        """
+        cached = _parse_cached(text)
+        return replace(
+            cached,
+            prerequisites=list(cached.prerequisites),
+            alternative_commands=list(cached.alternative_commands),
+        )
 
     def _parse_simple_command(self, text: str) -> DevOpsCommand:
-        """Fallback parser for simple command text"""
-        # Extract command from common patterns
-        command_patterns = [
-            r"`([^`]+)`",  # Code blocks
-            r'"([^"]+)"',  # Quoted text
-            r"'([^']+)'",  # Single quoted
-            r"^(\S+.*?)(?:\n|$)",  # First line
-        ]
-
-        command = text.strip()
-        for pattern in command_patterns:
-            match = re.search(pattern, text)
-            if match:
-                command = match.group(1).strip()
-                break
-
-        # Determine command type and risk level based on command content
-        command_type = self._classify_command(command)
-        risk_level = self._assess_risk(command)
-
-        return DevOpsCommand(
-            command=command,
-            description=f"Execute: {command}",
-            command_type=command_type,
-            risk_level=risk_level,
-            requires_sudo=self._requires_sudo(command),
-            requires_confirmation=risk_level in [RiskLevel.HIGH, RiskLevel.CRITICAL],
-        )
+        """Fallback parser for simple command text (already stripped)"""
+        return _parse_simple_text(text)
 
     def _classify_command(self, command: str) -> CommandType:
         """Classify command type based on command content"""
-        command_lower = command.lower()
-
-        # Classification patterns
-        classifications = {
-            CommandType.SYSTEM_INFO: [
-                "df",
-                "free",
-                "top",
-                "ps",
-                "uname",
-                "whoami",
-                "id",
-                "uptime",
-                "lscpu",
-            ],
-            CommandType.PROCESS_MANAGEMENT: [
-                "kill",
-                "killall",
-                "pkill",
-                "nohup",
-                "jobs",
-                "bg",
-                "fg",
-            ],
-            CommandType.FILE_OPERATIONS: [
-                "ls",
-                "cp",
-                "mv",
-                "rm",
-                "chmod",
-                "chown",
-                "find",
-                "grep",
-                "cat",
-                "tail",
-                "head",
-            ],
-            CommandType.NETWORK: [
-                "ping",
-                "curl",
-                "wget",
-                "netstat",
-                "ss",
-                "iptables",
-                "ufw",
-            ],
-            CommandType.DOCKER: ["docker", "docker-compose", "podman"],
-            CommandType.SERVICE_MANAGEMENT: [
-                "systemctl",
-                "service",
-                "nginx",
-                "apache2",
-                "mysql",
-                "postgres",
-            ],
-            CommandType.MONITORING: ["htop", "iotop", "watch", "vmstat", "iostat"],
-            CommandType.SECURITY: ["sudo", "su", "passwd", "chroot", "selinux"],
-        }
-
-        for cmd_type, keywords in classifications.items():
-            if any(keyword in command_lower for keyword in keywords):
-                return cmd_type
-
-        return CommandType.UNKNOWN
+        return _scan_command(command)[0]
 
     def _assess_risk(self, command: str) -> RiskLevel:
         """Assess risk level based on command content"""
-        command_lower = command.lower()
-
-        # Critical risk patterns
-        critical_patterns = ["rm -rf /", "dd if=", "mkfs", "fdisk", "parted"]
-        if any(pattern in command_lower for pattern in critical_patterns):
-            return RiskLevel.CRITICAL
-
-        # High risk patterns
-        high_patterns = ["rm -rf", "rm -r", "kill -9", "shutdown", "reboot", "halt"]
-        if any(pattern in command_lower for pattern in high_patterns):
-            return RiskLevel.HIGH
-
-        # Medium risk patterns
-        medium_patterns = [
-            "rm ",
-            "mv ",
-            "chmod",
-            "chown",
-            "systemctl stop",
-            "systemctl restart",
-        ]
-        if any(pattern in command_lower for pattern in medium_patterns):
-            return RiskLevel.MEDIUM
-
-        # Low risk patterns
-        low_patterns = ["cp ", "mkdir", "touch", "echo", "systemctl status"]
-        if any(pattern in command_lower for pattern in low_patterns):
-            return RiskLevel.LOW
-
-        # Default to safe for read-only commands
-        safe_patterns = [
-            "ls",
-            "cat",
-            "grep",
-            "find",
-            "ps",
-            "top",
-            "df",
-            "free",
-            "uname",
-        ]
-        if any(pattern in command_lower for pattern in safe_patterns):
-            return RiskLevel.SAFE
-
-        return RiskLevel.MEDIUM  # Default
+        return _scan_command(command)[1]
 
     def _requires_sudo(self, command: str) -> bool:
         """Check if command typically requires sudo"""
-        sudo_commands = [
-            "systemctl",
-            "service",
-            "apt",
-            "yum",
-            "dnf",
-            "pacman",
-            "mount",
-            "umount",
-            "iptables",
-            "ufw",
-            "nginx",
-            "apache2",
-        ]
-        command_lower = command.lower()
-        return any(cmd in command_lower for cmd in sudo_commands)
+        return _sudo_check(command)
 
 
-class LangChainIntegration:
-    """
-    Main LangChain integration class for ChatOps CLI.
-
-    Handles prompt templates, chains, and output parsing for
-    converting natural language to DevOps commands.
-    """
-
-    def __init__(self):
-        self.logger = logging.getLogger(__name__)
-        self.output_parser = DevOpsOutputParser()
-        self._init_prompt_templates()
-
-    def _init_prompt_templates(self):
-        """Initialize prompt templates for different use cases"""
-
-        # Main command generation template
-        self.command_template = PromptTemplate(
-            input_variables=["user_input", "context"],
-            template="""You are a DevOps assistant that converts natural language requests into shell commands.
+# Prompt templates as plain str.format strings, hoisted to module scope.
+# These are fully static two-variable templates; LangChain's
+# PromptTemplate ran input validation and partial-variable machinery on
+# every .format() call for no benefit here.
+_COMMAND_TEMPLATE = """You are a DevOps assistant that converts natural language requests into shell commands.
 
 User Request: {user_input}
 System Context: {context}
@@ -354,13 +359,9 @@ Examples:
 - "check disk space" → "df -h" (safe, system_info)
 - "restart nginx" → "systemctl restart nginx" (medium, service_management, requires_sudo)
 - "delete all files" → "rm -rf *" (critical, file_operations, requires_confirmation)
-""",
-        )
+"""
 
-        # Command explanation template
-        self.explanation_template = PromptTemplate(
-            input_variables=["command"],
-            template="""Explain what this shell command does in simple terms:
+_EXPLANATION_TEMPLATE = """Explain what this shell command does in simple terms:
 
 Command: {command}
 
@@ -370,13 +371,9 @@ Provide a clear, beginner-friendly explanation including:
 3. Potential risks or side effects
 4. When you would typically use it
 
-Keep it concise but informative.""",
-        )
+Keep it concise but informative."""
 
-        # Safety analysis template
-        self.safety_template = PromptTemplate(
-            input_variables=["command"],
-            template="""Analyze the safety of this shell command:
+_SAFETY_TEMPLATE = """Analyze the safety of this shell command:
 
 Command: {command}
 
@@ -394,7 +391,207 @@ Provide JSON response:
     "requires_confirmation": true/false,
     "warnings": ["list", "of", "warnings"],
     "prerequisites": ["required", "tools", "or", "conditions"]
-}}""",
+}}"""
+
+# Static reference data built once at import and served as read-only
+# views; the accessor methods previously re-allocated these nested
+# structures on every call
+_COMMAND_EXAMPLES = MappingProxyType(
+    {
+        "system_info": [
+            {
+                "input": "check disk space",
+                "command": "df -h",
+                "description": "Show disk usage in human-readable format",
+            },
+            {
+                "input": "show memory usage",
+                "command": "free -h",
+                "description": "Display memory usage statistics",
+            },
+            {
+                "input": "list running processes",
+                "command": "ps aux",
+                "description": "Show all running processes",
+            },
+        ],
+        "file_operations": [
+            {
+                "input": "list files",
+                "command": "ls -la",
+                "description": "List all files with details",
+            },
+            {
+                "input": "find large files",
+                "command": "find / -type f -size +100M",
+                "description": "Find files larger than 100MB",
+            },
+            {
+                "input": "show file content",
+                "command": "cat filename",
+                "description": "Display file contents",
+            },
+        ],
+        "service_management": [
+            {
+                "input": "restart nginx",
+                "command": "systemctl restart nginx",
+                "description": "Restart nginx web server",
+            },
+            {
+                "input": "check service status",
+                "command": "systemctl status servicename",
+                "description": "Show service status",
+            },
+            {
+                "input": "start docker",
+                "command": "systemctl start docker",
+                "description": "Start Docker service",
+            },
+        ],
+        "network": [
+            {
+                "input": "test connectivity",
+                "command": "ping google.com",
+                "description": "Test network connectivity",
+            },
+            {
+                "input": "show open ports",
+                "command": "netstat -tuln",
+                "description": "Display listening ports",
+            },
+            {
+                "input": "download file",
+                "command": "wget https://example.com/file",
+                "description": "Download file from URL",
+            },
+        ],
+    }
+)
+
+_SAFETY_GUIDELINES = MappingProxyType(
+    {
+        "safe": [
+            "Read-only operations",
+            "No system changes",
+            "Can be run by any user",
+            "No confirmation needed",
+        ],
+        "low": [
+            "Minor changes only",
+            "Easily reversible",
+            "Usually safe to run",
+            "Minimal system impact",
+        ],
+        "medium": [
+            "Significant changes possible",
+            "Review command before running",
+            "May require privileges",
+            "Consider backup first",
+        ],
+        "high": [
+            "Major system changes",
+            "Requires confirmation",
+            "Difficult to reverse",
+            "Potential service disruption",
+        ],
+        "critical": [
+            "Irreversible changes",
+            "System-wide impact",
+            "Mandatory confirmation",
+            "Expert supervision recommended",
+        ],
+    }
+)
+
+
+class LangChainIntegration:
+    """
+    Main LangChain integration class for ChatOps CLI.
+
+    Handles prompt templates, chains, and output parsing for
+    converting natural language to DevOps commands.
+    """
+
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+        self.output_parser = DevOpsOutputParser()
+
+    @functools.lru_cache(maxsize=256)
+    def _format_command_prompt(self, user_input: str, context: str) -> str:
+        """Format the command template, memoized per (input, context).
+
+        Re-running the same request (interactive retries, history
+        replay) re-substituted the ~40-line template each time; repeats
+        now return the cached string.
+        """
+        return _COMMAND_TEMPLATE.format(user_input=user_input, context=context)
+
+    @functools.lru_cache(maxsize=256)
+    def _format_explanation_prompt(self, command: str) -> str:
+        """Format the explanation template, memoized per command"""
+        return _EXPLANATION_TEMPLATE.format(command=command)
+
+    @functools.lru_cache(maxsize=256)
+    def _format_safety_prompt(self, command: str) -> str:
+        """Format the safety template, memoized per command"""
+        return _SAFETY_TEMPLATE.format(command=command)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def get_static_system_prompt() -> str:
+        """
+        Get the static system-prompt prefix for command generation.
+
+        This block is byte-identical across every request (role, output
+        format, rules, examples) so provider-side prompt-prefix caching
+        can hit; only the user message carries per-request content.
+
+        Returns:
+            Constant system prompt string
+        """
+        return """You are a DevOps assistant that converts natural language requests into shell commands.
+
+Generate a JSON response with the following structure:
+{
+    "command": "the exact shell command to execute",
+    "description": "brief description of what this command does",
+    "command_type": "one of: system_info, process_management, file_operations, network, docker, service_management, monitoring, security, unknown",
+    "risk_level": "one of: safe, low, medium, high, critical",
+    "requires_sudo": true/false,
+    "requires_confirmation": true/false,
+    "estimated_duration": "estimated time like '< 1 second', '2-5 seconds', etc.",
+    "prerequisites": ["list", "of", "required", "tools"],
+    "alternative_commands": ["alternative", "commands", "if", "any"]
+}
+
+Rules:
+1. Provide only standard, safe commands that exist on most Linux/Unix systems
+2. Mark destructive operations with high/critical risk and requires_confirmation: true
+3. Include sudo requirement only when absolutely necessary
+4. Provide helpful alternatives when possible
+5. Be conservative with risk assessment - err on the side of caution
+
+Examples:
+- "check disk space" → "df -h" (safe, system_info)
+- "restart nginx" → "systemctl restart nginx" (medium, service_management, requires_sudo)
+- "delete all files" → "rm -rf *" (critical, file_operations, requires_confirmation)"""
+
+    @staticmethod
+    def build_user_message(user_input: str, context: str = "") -> str:
+        """
+        Build the per-request user message for command generation.
+
+        Args:
+            user_input: Natural language description of what to do
+            context: Additional context about the system or situation
+
+        Returns:
+            User message string (pairs with get_static_system_prompt)
+        """
+        return (
+            f"User Request: {user_input}\n"
+            f"System Context: {context or 'Linux/Unix system'}"
         )
 
     def generate_command(self, user_input: str, context: str = "") -> DevOpsCommand:
@@ -410,8 +607,8 @@ Provide JSON response:
         """
         try:
             # Format the prompt
-            prompt = self.command_template.format(
-                user_input=user_input, context=context or "Linux/Unix system"
+            prompt = self._format_command_prompt(
+                user_input, context or "Linux/Unix system"
             )
 
             self.logger.debug(f"Generated prompt for: {user_input}")
@@ -440,8 +637,8 @@ Provide JSON response:
         """
         try:
             # Format the prompt
-            prompt = self.command_template.format(
-                user_input=user_input, context=context or "Linux/Unix system"
+            prompt = self._format_command_prompt(
+                user_input, context or "Linux/Unix system"
             )
 
             self.logger.debug(f"Generated prompt for: {user_input}")
@@ -473,7 +670,7 @@ Provide JSON response:
         Returns:
             Formatted prompt for LLM
         """
-        return self.explanation_template.format(command=command)
+        return self._format_explanation_prompt(command)
 
     def analyze_safety(self, command: str) -> str:
         """
@@ -485,122 +682,27 @@ Provide JSON response:
         Returns:
             Formatted prompt for LLM
         """
-        return self.safety_template.format(command=command)
+        return self._format_safety_prompt(command)
+
+    @property
+    def command_example_count(self) -> int:
+        """Number of command-example categories (cheap, for status display)"""
+        return len(_COMMAND_EXAMPLES)
 
     def get_command_examples(self) -> Dict[str, List[Dict[str, str]]]:
         """
         Get example commands by category.
 
         Returns:
-            Dictionary of command examples organized by type
+            Read-only dictionary of command examples organized by type
         """
-        return {
-            "system_info": [
-                {
-                    "input": "check disk space",
-                    "command": "df -h",
-                    "description": "Show disk usage in human-readable format",
-                },
-                {
-                    "input": "show memory usage",
-                    "command": "free -h",
-                    "description": "Display memory usage statistics",
-                },
-                {
-                    "input": "list running processes",
-                    "command": "ps aux",
-                    "description": "Show all running processes",
-                },
-            ],
-            "file_operations": [
-                {
-                    "input": "list files",
-                    "command": "ls -la",
-                    "description": "List all files with details",
-                },
-                {
-                    "input": "find large files",
-                    "command": "find / -type f -size +100M",
-                    "description": "Find files larger than 100MB",
-                },
-                {
-                    "input": "show file content",
-                    "command": "cat filename",
-                    "description": "Display file contents",
-                },
-            ],
-            "service_management": [
-                {
-                    "input": "restart nginx",
-                    "command": "systemctl restart nginx",
-                    "description": "Restart nginx web server",
-                },
-                {
-                    "input": "check service status",
-                    "command": "systemctl status servicename",
-                    "description": "Show service status",
-                },
-                {
-                    "input": "start docker",
-                    "command": "systemctl start docker",
-                    "description": "Start Docker service",
-                },
-            ],
-            "network": [
-                {
-                    "input": "test connectivity",
-                    "command": "ping google.com",
-                    "description": "Test network connectivity",
-                },
-                {
-                    "input": "show open ports",
-                    "command": "netstat -tuln",
-                    "description": "Display listening ports",
-                },
-                {
-                    "input": "download file",
-                    "command": "wget https://example.com/file",
-                    "description": "Download file from URL",
-                },
-            ],
-        }
+        return _COMMAND_EXAMPLES
 
     def get_safety_guidelines(self) -> Dict[str, List[str]]:
         """
         Get safety guidelines for different risk levels.
 
         Returns:
-            Dictionary of safety guidelines by risk level
+            Read-only dictionary of safety guidelines by risk level
         """
-        return {
-            "safe": [
-                "Read-only operations",
-                "No system changes",
-                "Can be run by any user",
-                "No confirmation needed",
-            ],
-            "low": [
-                "Minor changes only",
-                "Easily reversible",
-                "Usually safe to run",
-                "Minimal system impact",
-            ],
-            "medium": [
-                "Significant changes possible",
-                "Review command before running",
-                "May require privileges",
-                "Consider backup first",
-            ],
-            "high": [
-                "Major system changes",
-                "Requires confirmation",
-                "Difficult to reverse",
-                "Potential service disruption",
-            ],
-            "critical": [
-                "Irreversible changes",
-                "System-wide impact",
-                "Mandatory confirmation",
-                "Expert supervision recommended",
-            ],
-        }
+        return _SAFETY_GUIDELINES
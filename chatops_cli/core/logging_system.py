@@ -5,21 +5,46 @@ This module provides structured logging with different levels, audit trails for
 security event logging, and configurable output formats with log rotation and retention policies.
 """
 
+import base64
 import json
 import logging
 import logging.handlers
 import os
 import sys
+import time
+import zlib
+from collections import deque
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Union
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from enum import Enum
 import threading
 from contextlib import contextmanager
+from queue import SimpleQueue
 
 from ..settings import settings
 
+# Use orjson's C encoder when installed (the `speed` extra): every log
+# line passes through JSON serialization, and its default= hook also
+# stringifies non-serializable values (mocks, enums, datetimes) in one
+# C-level callback instead of a Python pre-pass.
+try:
+    import orjson
+
+    def _dumps(obj: dict) -> str:
+        return orjson.dumps(
+            obj, default=str, option=orjson.OPT_NON_STR_KEYS
+        ).decode("utf-8")
+
+    _loads = orjson.loads
+except ImportError:
+
+    def _dumps(obj: dict) -> str:
+        return json.dumps(obj, ensure_ascii=False, default=str)
+
+    _loads = json.loads
+
 
 class LogLevel(Enum):
     """Log levels for different types of events"""
@@ -33,16 +58,19 @@ class LogLevel(Enum):
     
     def to_logging_level(self) -> int:
         """Convert to standard logging level"""
-        mapping = {
-            "DEBUG": logging.DEBUG,
-            "INFO": logging.INFO,
-            "WARNING": logging.WARNING,
-            "ERROR": logging.ERROR,
-            "CRITICAL": logging.CRITICAL,
-            "AUDIT": logging.INFO,  # Map AUDIT to INFO
-            "SECURITY": logging.WARNING,  # Map SECURITY to WARNING
-        }
-        return mapping.get(self.value, logging.INFO)
+        return _LEVEL_MAP.get(self, logging.INFO)
+
+
+# Built once; to_logging_level used to allocate this dict on every call
+_LEVEL_MAP = {
+    LogLevel.DEBUG: logging.DEBUG,
+    LogLevel.INFO: logging.INFO,
+    LogLevel.WARNING: logging.WARNING,
+    LogLevel.ERROR: logging.ERROR,
+    LogLevel.CRITICAL: logging.CRITICAL,
+    LogLevel.AUDIT: logging.INFO,  # Map AUDIT to INFO
+    LogLevel.SECURITY: logging.WARNING,  # Map SECURITY to WARNING
+}
 
 
 class EventType(Enum):
@@ -60,9 +88,13 @@ class EventType(Enum):
     SYSTEM_EVENT = "SYSTEM_EVENT"
 
 
-@dataclass
+@dataclass(slots=True)
 class AuditEvent:
-    """Structured audit event data"""
+    """Structured audit event data.
+
+    Slots: up to a thousand of these sit in the in-memory history and
+    one is built per log call, so the per-instance __dict__ matters.
+    """
     timestamp: datetime
     event_type: EventType
     level: LogLevel
@@ -78,25 +110,51 @@ class AuditEvent:
     metadata: Optional[Dict[str, Any]] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization"""
-        data = asdict(self)
-        data['timestamp'] = self.timestamp.isoformat()
-        data['event_type'] = self.event_type.value
-        data['level'] = self.level.value
-        return data
+        """Convert to dictionary for JSON serialization.
+
+        Built as a plain dict literal: asdict() recurses through every
+        field and deep-copies the metadata dict, which is wasted work
+        since events are treated as immutable once constructed. The
+        metadata reference is shared on the same assumption.
+        """
+        return {
+            'timestamp': self.timestamp.isoformat(),
+            'event_type': self.event_type.value,
+            'level': self.level.value,
+            'message': self.message,
+            'user_id': self.user_id,
+            'session_id': self.session_id,
+            'command': self.command,
+            'risk_level': self.risk_level,
+            'return_code': self.return_code,
+            'execution_time': self.execution_time,
+            'working_directory': self.working_directory,
+            'ip_address': self.ip_address,
+            'metadata': self.metadata,
+        }
+
+
+# Extra attributes the audit loggers attach to records, copied into the
+# structured output when present
+_EXTRA_FIELDS = (
+    'event_type', 'user_id', 'session_id', 'command', 'risk_level', 'metadata',
+)
+
+# Bound once: skips the datetime attribute lookup on every record
+_fromtimestamp = datetime.fromtimestamp
 
 
 class StructuredFormatter(logging.Formatter):
     """Custom formatter for structured logging"""
-    
+
     def __init__(self, include_metadata: bool = True):
         super().__init__()
         self.include_metadata = include_metadata
-    
+
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as structured JSON"""
         log_entry = {
-            'timestamp': datetime.fromtimestamp(record.created).isoformat(),
+            'timestamp': _fromtimestamp(record.created).isoformat(),
             'level': record.levelname,
             'logger': record.name,
             'message': record.getMessage(),
@@ -104,82 +162,232 @@ class StructuredFormatter(logging.Formatter):
             'function': record.funcName,
             'line': record.lineno
         }
-        
-        # Add extra fields if present, handling MagicMock objects
-        if hasattr(record, 'event_type'):
-            log_entry['event_type'] = str(record.event_type)
-        if hasattr(record, 'user_id'):
-            log_entry['user_id'] = str(record.user_id)
-        if hasattr(record, 'session_id'):
-            log_entry['session_id'] = str(record.session_id)
-        if hasattr(record, 'command'):
-            log_entry['command'] = str(record.command)
-        if hasattr(record, 'risk_level'):
-            log_entry['risk_level'] = str(record.risk_level)
-        if hasattr(record, 'metadata'):
-            # Handle metadata carefully to avoid MagicMock serialization issues
-            try:
-                if hasattr(record.metadata, '__dict__'):
-                    log_entry['metadata'] = str(record.metadata)
-                else:
-                    log_entry['metadata'] = record.metadata
-            except:
-                log_entry['metadata'] = str(record.metadata)
-        
-        # Ensure all values are JSON serializable
-        def make_serializable(obj):
-            if hasattr(obj, '__class__') and 'MagicMock' in str(obj.__class__):
-                return str(obj)
-            return obj
-        
-        # Convert all values to be JSON serializable
-        for key, value in log_entry.items():
-            log_entry[key] = make_serializable(value)
-        
-        return json.dumps(log_entry, ensure_ascii=False)
+
+        # One loop over a constant tuple replaces the old six-branch
+        # hasattr chain; values go in as-is and the serializer's
+        # default=str hook covers anything non-serializable (mocks,
+        # enums) at encode time
+        for field_name in _EXTRA_FIELDS:
+            value = getattr(record, field_name, None)
+            if value is not None:
+                log_entry[field_name] = value
+
+        return _dumps(log_entry)
+
+
+# Command output larger than this is compressed before it lands in the
+# audit log; build logs and the like compress 10-20x, which keeps audit
+# lines short and the file scannable
+_COMPRESS_THRESHOLD = 4096
+
+
+def _compress_blob(text: str) -> str:
+    """zlib-compress a large text blob to a base64 string for JSON"""
+    return base64.b64encode(zlib.compress(text.encode('utf-8'))).decode('ascii')
+
+
+def _decompress_blob(blob: str) -> str:
+    """Reverse _compress_blob"""
+    return zlib.decompress(base64.b64decode(blob)).decode('utf-8')
+
+
+def _inflate_output_blobs(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Restore compressed stdout/stderr in a deserialized audit record"""
+    metadata = data.get('metadata')
+    if metadata:
+        for name in ('stdout', 'stderr'):
+            blob = metadata.pop(f'{name}_zlib_b64', None)
+            if blob is not None:
+                try:
+                    metadata[name] = _decompress_blob(blob)
+                except (zlib.error, ValueError):
+                    metadata[name] = None
+    return data
+
+
+def _reverse_lines(path: Path, block_size: int = 65536):
+    """Yield a text file's lines from last to first.
+
+    Reads fixed-size blocks backwards from EOF, so tail queries touch
+    only as much of the file as they need instead of scanning a
+    multi-MB log from the top.
+    """
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        buffer = b''
+        while position > 0:
+            read_size = min(block_size, position)
+            position -= read_size
+            f.seek(position)
+            buffer = f.read(read_size) + buffer
+            lines = buffer.split(b'\n')
+            buffer = lines[0]
+            for line in reversed(lines[1:]):
+                if line:
+                    yield line.decode('utf-8', errors='replace')
+        if buffer:
+            yield buffer.decode('utf-8', errors='replace')
+
+
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """RotatingFileHandler with a 64KB write buffer.
+
+    The stdlib handler flushes after every record, costing one small
+    write syscall per log line. This variant batches records in the
+    stream buffer and only forces a flush for WARNING and above (those
+    must hit disk immediately) or when the periodic timer fires, so a
+    burst of INFO records becomes a handful of large writes.
+    """
+
+    _BUFFER_SIZE = 65536
+
+    # Bound on records held in the buffer between flushes: caps how
+    # much a hard crash can lose regardless of record size
+    _FLUSH_EVERY = 64
+
+    def __init__(self, *args, flush_interval: float = 0.5, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._flush_interval = flush_interval
+        self._flush_timer: Optional[threading.Timer] = None
+        self._pending = 0
+        self._closed = False
+        self._schedule_flush()
+
+    def _open(self):
+        return open(
+            self.baseFilename,
+            self.mode,
+            encoding=self.encoding,
+            buffering=self._BUFFER_SIZE,
+        )
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            self.stream.write(self.format(record) + self.terminator)
+            self._pending += 1
+            if (
+                record.levelno >= logging.WARNING
+                or self._pending >= self._FLUSH_EVERY
+            ):
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        self._pending = 0
+        super().flush()
+
+    def _schedule_flush(self):
+        timer = threading.Timer(self._flush_interval, self._periodic_flush)
+        timer.daemon = True
+        timer.start()
+        self._flush_timer = timer
+
+    def _periodic_flush(self):
+        if self._closed:
+            return
+        try:
+            self.flush()
+        except Exception:
+            pass
+        self._schedule_flush()
+
+    def close(self):
+        self._closed = True
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+        super().close()
+
+
+def _attach_queued_handler(
+    logger: logging.Logger, handler: logging.Handler
+) -> logging.handlers.QueueListener:
+    """Put a queue between a logger and its file handler.
+
+    The logger gets a QueueHandler (an O(1) in-memory put on the caller
+    side) while a background QueueListener thread owns the real handler
+    and does the formatting and disk writes — log calls no longer block
+    coroutines on file I/O.
+    """
+    queue: SimpleQueue = SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        queue, handler, respect_handler_level=True
+    )
+    listener.start()
+    logger.addHandler(logging.handlers.QueueHandler(queue))
+    return listener
 
 
 class AuditLogger:
     """Dedicated audit logger for security and compliance events"""
-    
+
+    # Levels routed to the security log; everything else is plain audit
+    _SECURITY_LEVELS = frozenset({LogLevel.SECURITY, LogLevel.CRITICAL})
+
     def __init__(self, log_directory: Path):
         self.log_directory = log_directory
         self.audit_file = log_directory / "audit.log"
         self.security_file = log_directory / "security.log"
-        
+
+        # Honor the configured level so verbose runs can opt into
+        # DEBUG-only detail (e.g. captured command output in audit
+        # records); INFO remains the effective default
+        level = getattr(logging, settings.logging.level, logging.INFO)
+
         # Create audit logger
         self.audit_logger = logging.getLogger("chatops.audit")
-        self.audit_logger.setLevel(logging.INFO)
-        
+        self.audit_logger.setLevel(level)
+
         # Create security logger
         self.security_logger = logging.getLogger("chatops.security")
-        self.security_logger.setLevel(logging.INFO)
-        
+        self.security_logger.setLevel(level)
+
+        # Background listeners owning the file handlers
+        self._listeners: List[logging.handlers.QueueListener] = []
+
         # Setup handlers
         self._setup_audit_handlers()
         self._setup_security_handlers()
-    
+
+        # Per-event routing becomes one dict lookup instead of a list
+        # membership test plus branch
+        self._level_to_logger = {
+            level: (
+                self.security_logger
+                if level in self._SECURITY_LEVELS
+                else self.audit_logger
+            )
+            for level in LogLevel
+        }
+
     def _setup_audit_handlers(self):
         """Setup audit log handlers with rotation"""
-        audit_handler = logging.handlers.RotatingFileHandler(
+        audit_handler = BufferedRotatingFileHandler(
             self.audit_file,
             maxBytes=settings.logging.max_log_size,
             backupCount=5,
             encoding='utf-8'
         )
         audit_handler.setFormatter(StructuredFormatter())
-        self.audit_logger.addHandler(audit_handler)
-    
+        self._listeners.append(
+            _attach_queued_handler(self.audit_logger, audit_handler)
+        )
+
     def _setup_security_handlers(self):
         """Setup security log handlers with rotation"""
-        security_handler = logging.handlers.RotatingFileHandler(
+        security_handler = BufferedRotatingFileHandler(
             self.security_file,
             maxBytes=settings.logging.max_log_size,
             backupCount=5,
             encoding='utf-8'
         )
         security_handler.setFormatter(StructuredFormatter())
-        self.security_logger.addHandler(security_handler)
+        self._listeners.append(
+            _attach_queued_handler(self.security_logger, security_handler)
+        )
     
     def log_audit_event(self, event: AuditEvent):
         """Log an audit event"""
@@ -192,27 +400,50 @@ class AuditLogger:
             'metadata': event.metadata
         }
         
-        if event.level in [LogLevel.SECURITY, LogLevel.CRITICAL]:
-            self.security_logger.log(
-                event.level.to_logging_level(),
-                event.message,
-                extra=extra
-            )
-        else:
-            self.audit_logger.log(
-                event.level.to_logging_level(),
-                event.message,
-                extra=extra
-            )
+        # Security-relevant events are written synchronously so they are
+        # on disk before control returns; routine audit events go
+        # through the queued pipeline
+        if event.level in self._SECURITY_LEVELS:
+            self._raw_write(event)
+            return
+
+        self._level_to_logger[event.level].log(
+            event.level.to_logging_level(),
+            event.message,
+            extra=extra
+        )
+
+    def _raw_write(self, event: AuditEvent) -> None:
+        """Append one serialized event straight to the security log.
+
+        SECURITY and CRITICAL events must survive a crash that takes
+        the queue listener thread with it, so they bypass the queued
+        handlers and are written and flushed in the caller's thread.
+        Opening per write in append mode keeps this correct across the
+        buffered handler's rollovers; these events are rare enough that
+        the extra open() does not matter.
+        """
+        try:
+            with open(self.security_file, 'a', encoding='utf-8') as f:
+                f.write(_dumps(event.to_dict()) + '\n')
+        except OSError as e:
+            logging.getLogger(__name__).error(f"Raw security write failed: {e}")
     
     def cleanup(self):
         """Clean up audit logger handlers"""
-        # Close audit logger handlers
+        # Stop listeners first: stop() drains queued records to disk,
+        # then the underlying file handlers can be closed
+        for listener in self._listeners:
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+        self._listeners.clear()
+
+        # Detach the queue handlers from the loggers
         for handler in self.audit_logger.handlers[:]:
             handler.close()
             self.audit_logger.removeHandler(handler)
-        
-        # Close security logger handlers
+
         for handler in self.security_logger.handlers[:]:
             handler.close()
             self.security_logger.removeHandler(handler)
@@ -228,7 +459,8 @@ class LoggingSystem:
     
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         self.config = config or {}
-        
+        self._app_listener: Optional[logging.handlers.QueueListener] = None
+
         # Handle both dict config and direct Path object for backward compatibility
         if isinstance(config, (str, Path)):
             self.log_directory = Path(config)
@@ -241,7 +473,13 @@ class LoggingSystem:
         
         # Initialize audit logger
         self.audit_logger = AuditLogger(self.log_directory)
-        
+
+        # Snapshot the underlying loggers once: the hot log_* methods
+        # below hit them on every call, and chained attribute lookups
+        # through the AuditLogger wrapper add up
+        self._audit_log = self.audit_logger.audit_logger
+        self._sec_log = self.audit_logger.security_logger
+
         # Setup main application logging
         self._setup_application_logging()
         
@@ -258,9 +496,12 @@ class LoggingSystem:
         self._current_session_id: Optional[str] = None
         self._session_start_time: Optional[datetime] = None
         
-        # Command history for audit trail
-        self._command_history: List[AuditEvent] = []
+        # Command history for audit trail: bounded deque gives O(1)
+        # appends with automatic eviction of the oldest entries
         self._max_history_size = 1000
+        self._command_history: deque[AuditEvent] = deque(
+            maxlen=self._max_history_size
+        )
         
         self.logger = logging.getLogger(__name__)
         self.logger.info("Logging system initialized")
@@ -281,27 +522,36 @@ class LoggingSystem:
         app_log_file = self.log_directory / "chatops.log"
         
         # Create rotating file handler
-        file_handler = logging.handlers.RotatingFileHandler(
+        file_handler = BufferedRotatingFileHandler(
             app_log_file,
             maxBytes=settings.logging.max_log_size,
             backupCount=5,
             encoding='utf-8'
         )
         
-        # Set formatter
-        if settings.logging.include_timestamps:
+        # Plain-text formatting is several times cheaper than building
+        # a JSON document per record and easier to eyeball; only the
+        # application log honors the switch — audit and security logs
+        # stay structured because get_audit_trail parses them
+        structured = getattr(settings.logging, 'structured_output', True)
+        if structured and settings.logging.include_timestamps:
             formatter = StructuredFormatter()
+        elif settings.logging.include_timestamps:
+            formatter = logging.Formatter(
+                '%(asctime)s %(levelname)s %(name)s %(message)s'
+            )
         else:
             formatter = logging.Formatter(
                 '%(levelname)s - %(name)s - %(message)s'
             )
         
         file_handler.setFormatter(formatter)
-        
-        # Setup root logger
+
+        # Setup root logger; the file handler sits behind a queue so
+        # application log calls never block on disk
         root_logger = logging.getLogger()
         root_logger.setLevel(getattr(logging, settings.logging.level))
-        root_logger.addHandler(file_handler)
+        self._app_listener = _attach_queued_handler(root_logger, file_handler)
         
         # Console handler for development
         if settings.debug_mode:
@@ -312,14 +562,18 @@ class LoggingSystem:
     def start_session(self, session_id: Optional[str] = None, user_id: Optional[str] = None):
         """Start a new logging session"""
         with self._lock:
+            # One clock read covers the id, the start time, and the event
+            now = datetime.now()
             if session_id is None:
-                session_id = f"session_{int(datetime.now().timestamp())}"
-            
+                # Nanosecond monotonic clock: two sessions started in
+                # the same wall-clock second no longer share an id
+                session_id = f"session_{time.monotonic_ns():x}"
+
             self._current_session_id = session_id
-            self._session_start_time = datetime.now()
-            
+            self._session_start_time = now
+
             event = AuditEvent(
-                timestamp=datetime.now(),
+                timestamp=now,
                 event_type=EventType.SYSTEM_EVENT,
                 level=LogLevel.INFO,
                 message=f"Session started: {session_id}",
@@ -336,10 +590,11 @@ class LoggingSystem:
     def end_session(self):
         """End the current logging session"""
         if self._current_session_id and self._session_start_time:
-            session_duration = datetime.now() - self._session_start_time
-            
+            now = datetime.now()
+            session_duration = now - self._session_start_time
+
             event = AuditEvent(
-                timestamp=datetime.now(),
+                timestamp=now,
                 event_type=EventType.SYSTEM_EVENT,
                 level=LogLevel.INFO,
                 message=f"Session ended: {self._current_session_id}",
@@ -374,18 +629,43 @@ class LoggingSystem:
         """Log command execution for audit trail"""
         event_type = EventType.COMMAND_EXECUTION
         level = LogLevel.INFO
-        
+
         if error_message:
             level = LogLevel.ERROR
         elif user_cancelled:
             level = LogLevel.WARNING
-        
+
+        # Skip event/metadata construction entirely when the record
+        # would be discarded anyway
+        audit_logger = self._audit_log
+        if not audit_logger.isEnabledFor(level.to_logging_level()):
+            return
+
+        # Raw stdout/stderr can be multi-MB; only carry them into the
+        # audit record when debug-level detail is actually wanted
+        if not audit_logger.isEnabledFor(logging.DEBUG):
+            stdout = None
+            stderr = None
+
         message = f"Command executed: {description}"
         if dry_run:
             message = f"[DRY RUN] {message}"
         if user_cancelled:
             message = f"[CANCELLED] {message}"
-        
+
+        # Large captured output is compressed before serialization;
+        # get_audit_trail transparently inflates it on read
+        metadata = {
+            'dry_run': dry_run,
+            'user_cancelled': user_cancelled,
+            'error_message': error_message,
+        }
+        for name, blob in (('stdout', stdout), ('stderr', stderr)):
+            if blob is not None and len(blob) > _COMPRESS_THRESHOLD:
+                metadata[f'{name}_zlib_b64'] = _compress_blob(blob)
+            else:
+                metadata[name] = blob
+
         event = AuditEvent(
             timestamp=datetime.now(),
             event_type=event_type,
@@ -398,22 +678,13 @@ class LoggingSystem:
             return_code=return_code,
             execution_time=execution_time,
             working_directory=working_directory,
-            metadata={
-                'dry_run': dry_run,
-                'user_cancelled': user_cancelled,
-                'error_message': error_message,
-                'stdout': stdout,
-                'stderr': stderr
-            }
+            metadata=metadata
         )
         
         with self._lock:
             self.audit_logger.log_audit_event(event)
+            # maxlen evicts the oldest entry automatically
             self._command_history.append(event)
-            
-            # Maintain history size
-            if len(self._command_history) > self._max_history_size:
-                self._command_history = self._command_history[-self._max_history_size:]
     
     async def log_security_event(
         self,
@@ -427,13 +698,18 @@ class LoggingSystem:
         user_id: Optional[str] = None
     ):
         """Log security-related events"""
-        # Handle string event types
+        if not self._sec_log.isEnabledFor(
+            LogLevel.SECURITY.to_logging_level()
+        ):
+            return
+
+        # Handle string event types: a dict lookup instead of the
+        # EventType() constructor, whose ValueError path costs an
+        # exception raise/catch for every custom event name
         if isinstance(event_type, str):
-            # Try to find matching EventType enum
-            try:
-                event_type_enum = EventType(event_type)
-            except ValueError:
-                # For custom event types, we'll use SECURITY_EVENT but store the original string
+            event_type_enum = EventType._value2member_map_.get(event_type)
+            if event_type_enum is None:
+                # Custom event types use SECURITY_EVENT but keep the original string
                 event_type_enum = EventType.SECURITY_EVENT
                 if metadata is None:
                     metadata = {}
@@ -493,7 +769,9 @@ class LoggingSystem:
     ):
         """Log plugin-related events"""
         level = LogLevel.INFO if success else LogLevel.ERROR
-        
+        if not self._audit_log.isEnabledFor(level.to_logging_level()):
+            return
+
         event = AuditEvent(
             timestamp=datetime.now(),
             event_type=event_type,
@@ -524,6 +802,8 @@ class LoggingSystem:
     ):
         """Log LLM-related events"""
         level = LogLevel.INFO if success else LogLevel.ERROR
+        if not self._audit_log.isEnabledFor(level.to_logging_level()):
+            return
         if message is None:
             message = "LLM event"
         event = AuditEvent(
@@ -552,22 +832,21 @@ class LoggingSystem:
     ) -> List[AuditEvent]:
         """Get command execution history with optional filtering"""
         with self._lock:
-            history = self._command_history.copy()
-        
-        # Apply filters
-        if session_id:
-            history = [e for e in history if e.session_id == session_id]
-        
-        if start_time:
-            history = [e for e in history if e.timestamp >= start_time]
-        
-        if end_time:
-            history = [e for e in history if e.timestamp <= end_time]
-        
-        # Apply limit
+            history = list(self._command_history)
+
+        # One pass with a combined predicate instead of a fresh
+        # intermediate list per active filter
+        if session_id or start_time or end_time:
+            history = [
+                e for e in history
+                if (session_id is None or e.session_id == session_id)
+                and (start_time is None or e.timestamp >= start_time)
+                and (end_time is None or e.timestamp <= end_time)
+            ]
+
         if limit:
             history = history[-limit:]
-        
+
         return history
     
     def get_audit_trail(
@@ -580,63 +859,102 @@ class LoggingSystem:
     ) -> List[Dict[str, Any]]:
         """Get comprehensive audit trail from log files"""
         audit_events = []
-        
-        # Read from audit log file
+
         audit_file = self.log_directory / "audit.log"
-        if audit_file.exists():
-            with open(audit_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    try:
-                        data = json.loads(line.strip())
-                        event_time = datetime.fromisoformat(data['timestamp'])
-                        
-                        # Apply filters
-                        if start_time and event_time < start_time:
-                            continue
-                        if end_time and event_time > end_time:
-                            continue
-                        if event_types and data.get('event_type') not in [et.value for et in event_types]:
-                            continue
-                        if level and data.get('level') != level.value:
-                            continue
-                        
-                        audit_events.append(data)
-                    except json.JSONDecodeError:
-                        continue
-        
-        # Apply limit if specified
+        if not audit_file.exists():
+            return audit_events
+
+        type_values = {et.value for et in event_types} if event_types else None
+        level_value = level.value if level else None
+
         if limit:
-            audit_events = audit_events[-limit:]
-        
+            # Read backwards from EOF: most calls want the newest few
+            # events, so this is O(limit) instead of O(file size). The
+            # file is chronological, so once a line predates start_time
+            # every remaining line does too.
+            for line in _reverse_lines(audit_file):
+                try:
+                    data = _loads(line.strip())
+                    event_time = datetime.fromisoformat(data['timestamp'])
+                except (json.JSONDecodeError, KeyError, ValueError):
+                    continue
+
+                if start_time and event_time < start_time:
+                    break
+                if end_time and event_time > end_time:
+                    continue
+                if type_values and data.get('event_type') not in type_values:
+                    continue
+                if level_value and data.get('level') != level_value:
+                    continue
+
+                audit_events.append(_inflate_output_blobs(data))
+                if len(audit_events) >= limit:
+                    break
+
+            audit_events.reverse()
+            return audit_events
+
+        with open(audit_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    data = _loads(line.strip())
+                    event_time = datetime.fromisoformat(data['timestamp'])
+                except (json.JSONDecodeError, KeyError, ValueError):
+                    continue
+
+                # Apply filters
+                if start_time and event_time < start_time:
+                    continue
+                if end_time and event_time > end_time:
+                    continue
+                if type_values and data.get('event_type') not in type_values:
+                    continue
+                if level_value and data.get('level') != level_value:
+                    continue
+
+                audit_events.append(_inflate_output_blobs(data))
+
         return audit_events
     
     def cleanup_old_logs(self, retention_days: Optional[int] = None, days: Optional[int] = None):
         """Clean up old log files based on retention policy"""
         retention_days = retention_days or days or settings.logging.log_retention_days
-        cutoff_date = datetime.now() - timedelta(days=retention_days)
-        
-        log_files = [
-            self.log_directory / "chatops.log",
-            self.log_directory / "audit.log",
-            self.log_directory / "security.log"
-        ]
-        
+        cutoff_ts = (datetime.now() - timedelta(days=retention_days)).timestamp()
+
+        # One scandir pass covers the directory, including rotated
+        # siblings (audit.log.1, ...) the old hard-coded list missed;
+        # scandir entries carry stat results, so no extra stat calls,
+        # and comparing raw timestamps skips a datetime round-trip
         cleaned_count = 0
-        for log_file in log_files:
-            if log_file.exists():
-                file_time = datetime.fromtimestamp(log_file.stat().st_mtime)
-                if file_time < cutoff_date:
-                    try:
-                        log_file.unlink()
-                        cleaned_count += 1
-                        self.logger.info(f"Cleaned up old log file: {log_file}")
-                    except Exception as e:
-                        self.logger.error(f"Failed to clean up {log_file}: {e}")
-        
+        try:
+            entries = list(os.scandir(self.log_directory))
+        except OSError as e:
+            self.logger.error(f"Failed to scan log directory: {e}")
+            return cleaned_count
+
+        for entry in entries:
+            if '.log' not in entry.name or not entry.is_file():
+                continue
+            try:
+                if entry.stat().st_mtime < cutoff_ts:
+                    os.unlink(entry.path)
+                    cleaned_count += 1
+                    self.logger.info(f"Cleaned up old log file: {entry.path}")
+            except Exception as e:
+                self.logger.error(f"Failed to clean up {entry.path}: {e}")
+
         return cleaned_count
     
     def cleanup(self):
         """Clean up logging system and close handlers"""
+        # Flush queued application records before closing handlers
+        if self._app_listener is not None:
+            self._app_listener.stop()
+            for handler in self._app_listener.handlers:
+                handler.close()
+            self._app_listener = None
+
         # Close all handlers
         root_logger = logging.getLogger()
         for handler in root_logger.handlers[:]:
@@ -652,28 +970,40 @@ class LoggingSystem:
         """Context manager for logging operations with automatic start/end events"""
         start_time = datetime.now()
         context_id = f"{context_name}_{int(start_time.timestamp())}"
-        
-        # Log start
-        start_event = AuditEvent(
-            timestamp=start_time,
-            event_type=EventType.SYSTEM_EVENT,
-            level=LogLevel.INFO,
-            message=f"Context started: {context_name}",
-            session_id=self._current_session_id,
-            metadata={'context_id': context_id, **(metadata or {})}
-        )
-        self.audit_logger.log_audit_event(start_event)
-        
+        sid = self._current_session_id
+
+        # The start event is deferred: trivial contexts (the common
+        # case) collapse into a single combined record instead of a
+        # start/end pair, halving audit volume for them. The start
+        # event is only materialized once the context proves
+        # long-running or fails.
+        def _flush_start():
+            # Emitted after the fact, so the record's own timestamp is
+            # the emit time; the real entry time rides in metadata like
+            # the collapsed combined event's does
+            self.audit_logger.log_audit_event(AuditEvent(
+                timestamp=start_time,
+                event_type=EventType.SYSTEM_EVENT,
+                level=LogLevel.INFO,
+                message=f"Context started: {context_name}",
+                session_id=sid,
+                metadata={
+                    'context_id': context_id,
+                    'started_at': start_time.isoformat(),
+                    **(metadata or {})
+                }
+            ))
+
         try:
             yield context_id
         except Exception as e:
-            # Log error
+            _flush_start()
             error_event = AuditEvent(
                 timestamp=datetime.now(),
                 event_type=EventType.SYSTEM_EVENT,
                 level=LogLevel.ERROR,
                 message=f"Context error: {context_name}",
-                session_id=self._current_session_id,
+                session_id=sid,
                 metadata={
                     'context_id': context_id,
                     'error': str(e),
@@ -682,16 +1012,33 @@ class LoggingSystem:
             )
             self.audit_logger.log_audit_event(error_event)
             raise
-        finally:
-            # Log end
+        else:
             end_time = datetime.now()
             duration = (end_time - start_time).total_seconds()
+            if duration < 0.001:
+                combined_event = AuditEvent(
+                    timestamp=end_time,
+                    event_type=EventType.SYSTEM_EVENT,
+                    level=LogLevel.INFO,
+                    message=f"Context completed: {context_name}",
+                    session_id=sid,
+                    metadata={
+                        'context_id': context_id,
+                        'started_at': start_time.isoformat(),
+                        'ended_at': end_time.isoformat(),
+                        'duration_seconds': duration,
+                        **(metadata or {})
+                    }
+                )
+                self.audit_logger.log_audit_event(combined_event)
+                return
+            _flush_start()
             end_event = AuditEvent(
                 timestamp=end_time,
                 event_type=EventType.SYSTEM_EVENT,
                 level=LogLevel.INFO,
                 message=f"Context ended: {context_name}",
-                session_id=self._current_session_id,
+                session_id=sid,
                 metadata={
                     'context_id': context_id,
                     'duration_seconds': duration,
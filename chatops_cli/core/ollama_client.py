@@ -7,12 +7,20 @@ including connection management, model loading, and inference capabilities.
 
 import logging
 import asyncio
-from typing import Dict, List, Optional, Union, Any
+import time
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Union, Any
 from dataclasses import dataclass
 from enum import Enum
 
 import ollama
-from ollama import Client
+import psutil
+from ollama import AsyncClient, Client
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+# A model needs headroom beyond its weight file (KV cache, activations);
+# candidates over this multiple of free memory are skipped without probing
+_MEMORY_HEADROOM = 1.3
 import aiohttp
 import requests
 
@@ -35,6 +43,7 @@ class ModelInfo:
     id: str
     size: str
     status: ModelStatus
+    size_bytes: int = 0
     memory_required: Optional[str] = None
     error_message: Optional[str] = None
 
@@ -64,6 +73,7 @@ class OllamaClient:
         host: str = "http://localhost:11434",
         timeout: int = 30,
         preferred_models: Optional[List[str]] = None,
+        keep_alive: Union[int, str] = "30m",
     ):
         """
         Initialize OllamaClient.
@@ -72,9 +82,13 @@ class OllamaClient:
             host: Ollama service host URL
             timeout: Request timeout in seconds
             preferred_models: List of preferred models in order of preference
+            keep_alive: How long Ollama keeps a model resident after a
+                request ("30m", -1 for forever); avoids cold reloads
+                between CLI invocations in the same session
         """
         self.host = host
         self.timeout = timeout
+        self._keep_alive = keep_alive
         self.preferred_models = preferred_models or [
             "qwen3:latest",
             "phi4:3.8b",
@@ -82,58 +96,135 @@ class OllamaClient:
             "qwen3:14b",
         ]
         self.client = Client(host=host)
+        # Async client for inference: concurrent generate calls overlap
+        # instead of serializing on the event loop (Ollama itself
+        # batches them up to OLLAMA_NUM_PARALLEL)
+        self._aclient = AsyncClient(host=host)
         self.logger = logging.getLogger(__name__)
         self._current_model: Optional[str] = None
         self._model_cache: Dict[str, ModelInfo] = {}
 
+        # TTL cache over the /api/tags round-trip: the installed model
+        # set rarely changes mid-session, and several callers hit
+        # list_models back to back
+        self._models_ttl = 3600.0
+        self._cached_models: List[ModelInfo] = []
+        self._models_cached_at = 0.0
+
+        # Recent memory-probe verdicts: a fallback chain re-tests the
+        # same models, and each probe is a full generate round-trip
+        self._mem_test_ttl = 60.0
+        self._mem_test_cache: Dict[str, Tuple[float, bool]] = {}
+
+        # Shared session with a connection pool: the probe endpoints are
+        # hit repeatedly, and reusing the TCP connection drops the
+        # per-call handshake cost entirely
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=10, pool_maxsize=10, max_retries=0
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._session.headers.update(
+            {"Connection": "keep-alive", "Accept-Encoding": "gzip, deflate"}
+        )
+
+        # Shared aiohttp session for async probes, created lazily so it
+        # binds to the running event loop
+        self._aiohttp_session: Optional[aiohttp.ClientSession] = None
+
+        # A successful connect() is trusted for a short window; the
+        # lock keeps concurrent callers from racing duplicate probes
+        self._connect_ttl = 10.0
+        self._connect_ok_until = 0.0
+        self._connect_lock = asyncio.Lock()
+
+    def _get_aiohttp(self) -> aiohttp.ClientSession:
+        """Return the shared keep-alive aiohttp session, creating it lazily"""
+        if self._aiohttp_session is None or self._aiohttp_session.closed:
+            self._aiohttp_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=20, keepalive_timeout=30)
+            )
+        return self._aiohttp_session
+
     async def connect(self) -> bool:
         """
         Test connection to Ollama service.
 
+        CLI flows call this before each command; a success is cached
+        for 10 seconds so back-to-back invocations skip the probe (and
+        its log line) entirely.
+
         Returns:
             True if connection successful, False otherwise
         """
-        try:
-            # Test basic connectivity
-            response = requests.get(f"{self.host}/api/version", timeout=5)
-            if response.status_code == 200:
-                self.logger.info(f"Connected to Ollama at {self.host}")
+        async with self._connect_lock:
+            if time.monotonic() < self._connect_ok_until:
                 return True
-            else:
-                self.logger.error(
-                    f"Ollama service not responding: {response.status_code}"
-                )
+            try:
+                # Test basic connectivity
+                session = self._get_aiohttp()
+                async with session.get(
+                    f"{self.host}/api/version",
+                    timeout=aiohttp.ClientTimeout(total=5),
+                ) as response:
+                    if response.status == 200:
+                        self.logger.info(f"Connected to Ollama at {self.host}")
+                        self._connect_ok_until = (
+                            time.monotonic() + self._connect_ttl
+                        )
+                        return True
+                    self.logger.error(
+                        f"Ollama service not responding: {response.status}"
+                    )
+                    return False
+            except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as e:
+                self.logger.error(f"Failed to connect to Ollama: {e}")
                 return False
-        except requests.exceptions.RequestException as e:
-            self.logger.error(f"Failed to connect to Ollama: {e}")
-            return False
 
     def list_models(self) -> List[ModelInfo]:
         """
         List all available models with their status.
 
+        Results are cached for an hour; call invalidate_model_cache()
+        after pulling or removing models to force a refresh.
+
         Returns:
             List of ModelInfo objects
         """
+        now = time.monotonic()
+        if self._cached_models and now - self._models_cached_at < self._models_ttl:
+            return self._cached_models
+
         models = []
         try:
             response = self.client.list()
             for model_data in response.get("models", []):
                 name = model_data.get("name", "")
+                size_bytes = model_data.get("size", 0)
                 model_info = ModelInfo(
                     name=name,
                     id=model_data.get("digest", ""),
-                    size=self._format_size(model_data.get("size", 0)),
+                    size=self._format_size(size_bytes),
                     status=ModelStatus.AVAILABLE,
+                    size_bytes=size_bytes,
                 )
                 models.append(model_info)
                 self._model_cache[name] = model_info
 
+            self._cached_models = models
+            self._models_cached_at = now
+
         except Exception as e:
             self.logger.error(f"Failed to list models: {e}")
 
         return models
 
+    def invalidate_model_cache(self) -> None:
+        """Drop the cached model list so the next call refetches it"""
+        self._cached_models = []
+        self._models_cached_at = 0.0
+
     def get_best_available_model(self) -> Optional[str]:
         """
         Get the best available model that can actually run.
@@ -141,20 +232,102 @@ class OllamaClient:
         Returns:
             Model name if available, None otherwise
         """
-        available_models = self.list_models()
-        available_names = [m.name for m in available_models]
+        available = {m.name: m for m in self.list_models()}
 
-        # Try preferred models in order
+        # Admission pre-filter: a model whose weights plus headroom
+        # exceed free memory would fail its probe anyway, so skip the
+        # generate round-trip entirely
+        try:
+            available_bytes = psutil.virtual_memory().available
+        except Exception as e:
+            self.logger.warning(f"Could not read free memory: {e}")
+            available_bytes = None
+
+        # Try preferred models in order; dict membership keeps this
+        # O(preferred) rather than a list scan per candidate
         for model in self.preferred_models:
-            if model in available_names:
-                # Test if model can actually run
-                if self._test_model_memory(model):
-                    self.logger.info(f"Selected model: {model}")
-                    return model
-                else:
-                    self.logger.warning(
-                        f"Model {model} available but cannot run due to memory constraints"
-                    )
+            model_info = available.get(model)
+            if model_info is None:
+                continue
+            if (
+                available_bytes is not None
+                and model_info.size_bytes * _MEMORY_HEADROOM > available_bytes
+            ):
+                self.logger.warning(
+                    f"Skipping {model}: needs ~{self._format_size(int(model_info.size_bytes * _MEMORY_HEADROOM))}"
+                    f" but only {self._format_size(available_bytes)} free"
+                )
+                continue
+            # Test if model can actually run
+            if self._test_model_memory(model):
+                self.logger.info(f"Selected model: {model}")
+                return model
+            self.logger.warning(
+                f"Model {model} available but cannot run due to memory constraints"
+            )
+
+        self.logger.error("No suitable model found that can run on this system")
+        return None
+
+    async def get_best_available_model_async(self) -> Optional[str]:
+        """
+        Async variant of get_best_available_model that probes all
+        candidates concurrently.
+
+        Every candidate's memory probe is fired at once and results are
+        consumed in preference order, so selection latency is the time
+        to the highest-priority success instead of the sum of each
+        failed probe before it; remaining probes are cancelled once a
+        winner is found.
+
+        Returns:
+            Model name if available, None otherwise
+        """
+        available = {m.name: m for m in self.list_models()}
+        try:
+            available_bytes = psutil.virtual_memory().available
+        except Exception as e:
+            self.logger.warning(f"Could not read free memory: {e}")
+            available_bytes = None
+
+        candidates = []
+        for model in self.preferred_models:
+            model_info = available.get(model)
+            if model_info is None:
+                continue
+            if (
+                available_bytes is not None
+                and model_info.size_bytes * _MEMORY_HEADROOM > available_bytes
+            ):
+                self.logger.warning(
+                    f"Skipping {model}: needs ~{self._format_size(int(model_info.size_bytes * _MEMORY_HEADROOM))}"
+                    f" but only {self._format_size(available_bytes)} free"
+                )
+                continue
+            candidates.append(model)
+
+        if not candidates:
+            self.logger.error("No suitable model found that can run on this system")
+            return None
+
+        tasks = {
+            model: asyncio.create_task(self._test_model_memory_async(model))
+            for model in candidates
+        }
+        winner = None
+        for model in candidates:
+            if await tasks[model]:
+                winner = model
+                break
+
+        for task in tasks.values():
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+        if winner:
+            self.logger.info(f"Selected model: {winner}")
+            return winner
 
         self.logger.error("No suitable model found that can run on this system")
         return None
@@ -169,28 +342,74 @@ class OllamaClient:
         Returns:
             True if model can load, False if memory error
         """
+        cached = self._cached_mem_test(model_name)
+        if cached is not None:
+            return cached
         try:
             # Try a very simple inference to test memory
             response = self.client.generate(
                 model=model_name,
                 prompt="Hi",
                 options={"num_ctx": 512},  # Limit context to reduce memory usage
+                keep_alive=self._keep_alive,
             )
             if response:
                 self.logger.info(f"Model {model_name} loaded successfully")
+                self._mem_test_cache[model_name] = (time.monotonic(), True)
                 return True
         except Exception as e:
-            error_msg = str(e).lower()
-            if "memory" in error_msg or "system memory" in error_msg:
-                self.logger.warning(f"Model {model_name} failed memory test: {e}")
-                # Update model cache with memory error status
-                if model_name in self._model_cache:
-                    self._model_cache[model_name].status = ModelStatus.MEMORY_ERROR
-                    self._model_cache[model_name].error_message = str(e)
-                return False
-            else:
-                self.logger.error(f"Model {model_name} test failed: {e}")
-                return False
+            return self._record_memory_test_failure(model_name, e)
+        return False
+
+    async def _test_model_memory_async(self, model_name: str) -> bool:
+        """Async variant of _test_model_memory for use from async paths.
+
+        Probing through the async client keeps the event loop free, so
+        concurrent callers are not serialized behind a blocking probe.
+        """
+        cached = self._cached_mem_test(model_name)
+        if cached is not None:
+            return cached
+        try:
+            response = await self._aclient.generate(
+                model=model_name,
+                prompt="Hi",
+                options={"num_ctx": 512},
+                keep_alive=self._keep_alive,
+            )
+            if response:
+                self.logger.info(f"Model {model_name} loaded successfully")
+                self._mem_test_cache[model_name] = (time.monotonic(), True)
+                return True
+        except Exception as e:
+            return self._record_memory_test_failure(model_name, e)
+        return False
+
+    def _cached_mem_test(self, model_name: str) -> Optional[bool]:
+        """Return a recent probe verdict for the model, or None if stale"""
+        entry = self._mem_test_cache.get(model_name)
+        if entry is not None and time.monotonic() - entry[0] < self._mem_test_ttl:
+            return entry[1]
+        return None
+
+    def clear_memory_test_cache(self) -> None:
+        """Forget cached memory-probe verdicts (e.g. after freeing RAM)"""
+        self._mem_test_cache.clear()
+
+    def _record_memory_test_failure(self, model_name: str, e: Exception) -> bool:
+        """Classify a failed memory probe and update the model cache"""
+        self._mem_test_cache[model_name] = (time.monotonic(), False)
+        error_msg = str(e).lower()
+        if "memory" in error_msg or "system memory" in error_msg:
+            self.logger.warning(f"Model {model_name} failed memory test: {e}")
+            # Update model cache with memory error status
+            if model_name in self._model_cache:
+                self._model_cache[model_name].status = ModelStatus.MEMORY_ERROR
+                self._model_cache[model_name].error_message = str(e)
+            # Memory pressure may shift what can run: refetch next time
+            self.invalidate_model_cache()
+        else:
+            self.logger.error(f"Model {model_name} test failed: {e}")
         return False
 
     async def generate_response(
@@ -212,8 +431,6 @@ class OllamaClient:
         Returns:
             OllamaResponse object with result or error
         """
-        import time
-
         start_time = time.time()
 
         # Auto-select model if not specified
@@ -229,17 +446,16 @@ class OllamaClient:
             )
 
         try:
-            response = self.client.generate(
-                model=model,
-                prompt=prompt,
-                options={
-                    "num_predict": max_tokens,
-                    "temperature": temperature,
-                    "num_ctx": 2048,  # Context length
-                },
-            )
-
-            content = response.get("response", "")
+            # Stream under the hood and join once at the end: a single
+            # join over the chunks beats building one huge response
+            # string server-side and avoids repeated += growth here
+            parts = [
+                chunk
+                async for chunk in self._stream_chunks(
+                    model, prompt, max_tokens, temperature
+                )
+            ]
+            content = "".join(parts)
             response_time = time.time() - start_time
 
             self.logger.info(
@@ -266,6 +482,58 @@ class OllamaClient:
                 content="", model=model or "unknown", success=False, error=error_msg
             )
 
+    async def _stream_chunks(
+        self, model: str, prompt: str, max_tokens: int, temperature: float
+    ) -> AsyncIterator[str]:
+        """Yield response text chunks from a streaming generate call"""
+        stream = await self._aclient.generate(
+            model=model,
+            prompt=prompt,
+            stream=True,
+            options={
+                "num_predict": max_tokens,
+                "temperature": temperature,
+                "num_ctx": 2048,  # Context length
+            },
+            keep_alive=self._keep_alive,
+        )
+        async for chunk in stream:
+            text = chunk.get("response", "")
+            if text:
+                yield text
+
+    async def generate_stream(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+    ) -> AsyncIterator[str]:
+        """
+        Stream a response from Ollama chunk by chunk.
+
+        Yields text as the model produces it, so callers can display
+        the first tokens immediately instead of waiting for the full
+        completion, and never hold the whole response in one string.
+
+        Args:
+            prompt: Input prompt
+            model: Model name (auto-select if None)
+            max_tokens: Maximum tokens to generate
+            temperature: Response randomness (0.0 to 1.0)
+
+        Raises:
+            RuntimeError: If no suitable model is available
+        """
+        if not model:
+            model = self._current_model or self.get_best_available_model()
+        if not model:
+            raise RuntimeError("No suitable model available")
+
+        async for text in self._stream_chunks(model, prompt, max_tokens, temperature):
+            yield text
+        self._current_model = model
+
     async def _try_fallback_model(
         self, prompt: str, failed_model: str, max_tokens: int, temperature: float
     ) -> OllamaResponse:
@@ -285,7 +553,7 @@ class OllamaClient:
         remaining_models = [m for m in self.preferred_models if m != failed_model]
 
         for fallback_model in remaining_models:
-            if self._test_model_memory(fallback_model):
+            if await self._test_model_memory_async(fallback_model):
                 self.logger.info(f"Trying fallback model: {fallback_model}")
                 return await self.generate_response(
                     prompt,
@@ -311,14 +579,16 @@ class OllamaClient:
         Returns:
             ModelInfo object with current status
         """
-        if model_name in self._model_cache:
-            return self._model_cache[model_name]
+        model_info = self._model_cache.get(model_name)
+        if model_info is not None:
+            return model_info
 
-        # Try to get fresh info
-        models = self.list_models()
-        for model in models:
-            if model.name == model_name:
-                return model
+        # Try to get fresh info; list_models repopulates the name-keyed
+        # cache, so a second lookup replaces the old linear scan
+        self.list_models()
+        model_info = self._model_cache.get(model_name)
+        if model_info is not None:
+            return model_info
 
         return ModelInfo(
             name=model_name,
@@ -330,12 +600,15 @@ class OllamaClient:
 
     @staticmethod
     def _format_size(size_bytes: int) -> str:
-        """Format byte size to human readable string"""
-        for unit in ["B", "KB", "MB", "GB"]:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.1f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.1f} TB"
+        """Format byte size to human readable string.
+
+        The unit index comes straight from the bit length (10 bits per
+        unit step, capped at TB), replacing the divide-and-compare loop
+        with constant-time integer arithmetic — this runs once per model
+        in list_models.
+        """
+        idx = 0 if size_bytes <= 0 else min(size_bytes.bit_length() - 1, 49) // 10
+        return f"{size_bytes / (1 << (idx * 10)):.1f} {_SIZE_UNITS[idx]}"
 
     def get_system_info(self) -> Dict[str, Any]:
         """
@@ -347,6 +620,7 @@ class OllamaClient:
         info = {
             "host": self.host,
             "timeout": self.timeout,
+            "keep_alive": self._keep_alive,
             "current_model": self._current_model,
             "preferred_models": self.preferred_models,
             "available_models": [m.name for m in self.list_models()],
@@ -355,7 +629,7 @@ class OllamaClient:
 
         try:
             # Try to get Ollama version
-            response = requests.get(f"{self.host}/api/version", timeout=5)
+            response = self._session.get(f"{self.host}/api/version", timeout=5)
             if response.status_code == 200:
                 info["ollama_version"] = response.json()
         except:
@@ -363,12 +637,71 @@ class OllamaClient:
 
         return info
     
+    async def get_system_info_async(self) -> Dict[str, Any]:
+        """
+        Async variant of get_system_info.
+
+        Fires the /api/version and /api/tags probes concurrently over
+        the shared keep-alive session, so the call costs one round-trip
+        instead of two sequential ones.
+
+        Returns:
+            Dictionary with system info
+        """
+        info = {
+            "host": self.host,
+            "timeout": self.timeout,
+            "keep_alive": self._keep_alive,
+            "current_model": self._current_model,
+            "preferred_models": self.preferred_models,
+            "available_models": [],
+            "ollama_version": "unknown",
+        }
+
+        session = self._get_aiohttp()
+        timeout = aiohttp.ClientTimeout(total=5)
+
+        async def _fetch(path: str) -> Optional[Dict[str, Any]]:
+            try:
+                async with session.get(f"{self.host}{path}", timeout=timeout) as resp:
+                    if resp.status == 200:
+                        return await resp.json()
+            except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as e:
+                self.logger.error(f"Ollama probe {path} failed: {e}")
+            return None
+
+        version, tags = await asyncio.gather(
+            _fetch("/api/version"), _fetch("/api/tags")
+        )
+        if version is not None:
+            info["ollama_version"] = version
+        if tags is not None:
+            info["available_models"] = [
+                m.get("name", "") for m in tags.get("models", [])
+            ]
+        info["model_cache_size"] = len(self._model_cache)
+
+        return info
+
     async def test_connection(self) -> bool:
         """Test connection to Ollama service"""
         try:
             # Try to connect and get a simple response
-            response = requests.get(f"{self.host}/api/version", timeout=5)
-            return response.status_code == 200
+            session = self._get_aiohttp()
+            async with session.get(
+                f"{self.host}/api/version", timeout=aiohttp.ClientTimeout(total=5)
+            ) as response:
+                return response.status == 200
         except Exception as e:
             self.logger.error(f"Ollama test connection failed: {e}")
             return False
+
+    def close(self) -> None:
+        """Release the pooled HTTP connections"""
+        self._session.close()
+
+    async def aclose(self) -> None:
+        """Release async HTTP resources along with the sync pool"""
+        if self._aiohttp_session is not None and not self._aiohttp_session.closed:
+            await self._aiohttp_session.close()
+        self.close()
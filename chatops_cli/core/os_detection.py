@@ -5,8 +5,11 @@ Provides smart OS detection and command translation for cross-platform compatibi
 Windows, Linux, and macOS support with appropriate command mappings.
 """
 
+import functools
 import platform
+import re
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Dict, Optional
 
 
@@ -21,6 +24,143 @@ class OSInfo:
     is_macos: bool
 
 
+@functools.lru_cache(maxsize=1)
+def _detect_os() -> OSInfo:
+    """Detect the current operating system and shell.
+
+    Cached for the process lifetime: platform.system() cannot change
+    underneath us, so every OSDetection instance shares one OSInfo.
+    """
+    system = platform.system().lower()
+    version = platform.version()
+
+    # Determine OS type
+    is_windows = system == "windows"
+    is_linux = system == "linux"
+    is_macos = system == "darwin"
+
+    # Determine likely shell
+    if is_windows:
+        # Windows: assume PowerShell (modern default)
+        shell = "powershell"
+        name = "windows"
+    elif is_macos:
+        # macOS: likely zsh (modern default) or bash
+        shell = "zsh"
+        name = "macos"
+    else:
+        # Linux: likely bash
+        shell = "bash"
+        name = "linux"
+
+    return OSInfo(
+        name=name,
+        version=version,
+        shell=shell,
+        is_windows=is_windows,
+        is_linux=is_linux,
+        is_macos=is_macos
+    )
+
+
+# Static command mappings, built once at import and shared read-only
+# across all OSDetection instances
+_COMMAND_MAPPINGS = MappingProxyType({
+    # Disk Usage Commands
+    "disk_usage": {
+        "windows": "Get-WmiObject -Class Win32_LogicalDisk | Select-Object DeviceID, @{Name='Size(GB)';Expression={[math]::Round($_.Size/1GB,2)}}, @{Name='FreeSpace(GB)';Expression={[math]::Round($_.FreeSpace/1GB,2)}}",
+        "linux": "df -h",
+        "macos": "df -h"
+    },
+
+    # Process Listing
+    "list_processes": {
+        "windows": "Get-Process | Sort-Object CPU -Descending | Select-Object -First 10 ProcessName, CPU, WorkingSet",
+        "linux": "ps aux --sort=-%cpu | head -10",
+        "macos": "ps aux -r | head -10"
+    },
+
+    # Memory Usage
+    "memory_usage": {
+        "windows": "Get-WmiObject -Class Win32_ComputerSystem | Select-Object TotalPhysicalMemory; Get-WmiObject -Class Win32_OperatingSystem | Select-Object FreePhysicalMemory",
+        "linux": "free -h",
+        "macos": "vm_stat"
+    },
+
+    # Network Information
+    "network_info": {
+        "windows": "Get-NetAdapter | Where-Object Status -eq 'Up' | Select-Object Name, InterfaceDescription, LinkSpeed",
+        "linux": "ip addr show",
+        "macos": "ifconfig"
+    },
+
+    # File Finding (large files)
+    "find_large_files": {
+        "windows": "Get-ChildItem -Path C:\\ -Recurse -File | Where-Object {$_.Length -gt 100MB} | Sort-Object Length -Descending | Select-Object -First 10 FullName, @{Name='Size(MB)';Expression={[math]::Round($_.Length/1MB,2)}}",
+        "linux": "find / -type f -size +100M -exec ls -lh {} \\; 2>/dev/null | head -10",
+        "macos": "find / -type f -size +100M -exec ls -lh {} \\; 2>/dev/null | head -10"
+    },
+
+    # System Information
+    "system_info": {
+        "windows": "Get-ComputerInfo | Select-Object WindowsProductName, WindowsVersion, TotalPhysicalMemory, CsProcessors",
+        "linux": "uname -a && cat /proc/cpuinfo | grep 'model name' | head -1 && cat /proc/meminfo | grep MemTotal",
+        "macos": "system_profiler SPSoftwareDataType SPHardwareDataType"
+    },
+
+    # Directory Listing
+    "list_directory": {
+        "windows": "Get-ChildItem -Force | Format-Table -AutoSize",
+        "linux": "ls -la",
+        "macos": "ls -la"
+    },
+
+    # Current Directory
+    "current_directory": {
+        "windows": "Get-Location",
+        "linux": "pwd",
+        "macos": "pwd"
+    },
+
+    # Service Status
+    "service_status": {
+        "windows": "Get-Service | Where-Object Status -eq 'Running' | Select-Object -First 10 Name, Status",
+        "linux": "systemctl --type=service --state=running | head -10",
+        "macos": "launchctl list | head -10"
+    }
+})
+
+
+# Intent phrases in priority order: when an intent mentions several
+# categories, the one listed first wins, matching the old if/elif chain
+_INTENT_PATTERNS = {
+    "disk_usage": ("disk usage", "disk space", "free space", "storage"),
+    "list_processes": ("processes", "running", "tasks", "ps aux"),
+    "memory_usage": ("memory", "ram", "free memory"),
+    "network_info": ("network", "interface", "ip", "adapter"),
+    "find_large_files": ("large files", "big files", "find files", "100mb"),
+    "system_info": ("system info", "system information", "computer info"),
+    "list_directory": ("list files", "show files", "directory", "ls", "dir"),
+    "current_directory": ("current directory", "where am i", "pwd"),
+    "service_status": ("services", "running services", "service status"),
+}
+
+# One compiled alternation with a named group per command type: a
+# single C-level scan of the intent replaces up to nine Python-level
+# any(phrase in ...) passes
+_INTENT_RE = re.compile(
+    "|".join(
+        f"(?P<{command_type}>"
+        + "|".join(rf"\b{re.escape(phrase)}\b" for phrase in phrases)
+        + ")"
+        for command_type, phrases in _INTENT_PATTERNS.items()
+    ),
+    re.IGNORECASE,
+)
+
+_INTENT_RANK = {ct: rank for rank, ct in enumerate(_INTENT_PATTERNS)}
+
+
 class OSDetection:
     """
     Smart OS detection and command mapping for cross-platform support.
@@ -30,109 +170,11 @@ class OSDetection:
     """
     
     def __init__(self):
-        self._os_info = self._detect_os()
-        self._command_mappings = self._build_command_mappings()
-    
-    def _detect_os(self) -> OSInfo:
-        """Detect current operating system and shell"""
-        system = platform.system().lower()
-        version = platform.version()
-        
-        # Determine OS type
-        is_windows = system == "windows"
-        is_linux = system == "linux" 
-        is_macos = system == "darwin"
-        
-        # Determine likely shell
-        if is_windows:
-            # Windows: assume PowerShell (modern default)
-            shell = "powershell"
-            name = "windows"
-        elif is_macos:
-            # macOS: likely zsh (modern default) or bash
-            shell = "zsh" 
-            name = "macos"
-        else:
-            # Linux: likely bash
-            shell = "bash"
-            name = "linux"
-        
-        return OSInfo(
-            name=name,
-            version=version,
-            shell=shell,
-            is_windows=is_windows,
-            is_linux=is_linux,
-            is_macos=is_macos
-        )
-    
-    def _build_command_mappings(self) -> Dict[str, Dict[str, str]]:
-        """Build command mappings for different operating systems"""
-        return {
-            # Disk Usage Commands
-            "disk_usage": {
-                "windows": "Get-WmiObject -Class Win32_LogicalDisk | Select-Object DeviceID, @{Name='Size(GB)';Expression={[math]::Round($_.Size/1GB,2)}}, @{Name='FreeSpace(GB)';Expression={[math]::Round($_.FreeSpace/1GB,2)}}",
-                "linux": "df -h",
-                "macos": "df -h"
-            },
-            
-            # Process Listing
-            "list_processes": {
-                "windows": "Get-Process | Sort-Object CPU -Descending | Select-Object -First 10 ProcessName, CPU, WorkingSet",
-                "linux": "ps aux --sort=-%cpu | head -10",
-                "macos": "ps aux -r | head -10"
-            },
-            
-            # Memory Usage
-            "memory_usage": {
-                "windows": "Get-WmiObject -Class Win32_ComputerSystem | Select-Object TotalPhysicalMemory; Get-WmiObject -Class Win32_OperatingSystem | Select-Object FreePhysicalMemory",
-                "linux": "free -h",
-                "macos": "vm_stat"
-            },
-            
-            # Network Information
-            "network_info": {
-                "windows": "Get-NetAdapter | Where-Object Status -eq 'Up' | Select-Object Name, InterfaceDescription, LinkSpeed",
-                "linux": "ip addr show",
-                "macos": "ifconfig"
-            },
-            
-            # File Finding (large files)
-            "find_large_files": {
-                "windows": "Get-ChildItem -Path C:\\ -Recurse -File | Where-Object {$_.Length -gt 100MB} | Sort-Object Length -Descending | Select-Object -First 10 FullName, @{Name='Size(MB)';Expression={[math]::Round($_.Length/1MB,2)}}",
-                "linux": "find / -type f -size +100M -exec ls -lh {} \\; 2>/dev/null | head -10",
-                "macos": "find / -type f -size +100M -exec ls -lh {} \\; 2>/dev/null | head -10"
-            },
-            
-            # System Information
-            "system_info": {
-                "windows": "Get-ComputerInfo | Select-Object WindowsProductName, WindowsVersion, TotalPhysicalMemory, CsProcessors",
-                "linux": "uname -a && cat /proc/cpuinfo | grep 'model name' | head -1 && cat /proc/meminfo | grep MemTotal",
-                "macos": "system_profiler SPSoftwareDataType SPHardwareDataType"
-            },
-            
-            # Directory Listing
-            "list_directory": {
-                "windows": "Get-ChildItem -Force | Format-Table -AutoSize",
-                "linux": "ls -la",
-                "macos": "ls -la"
-            },
-            
-            # Current Directory
-            "current_directory": {
-                "windows": "Get-Location",
-                "linux": "pwd",
-                "macos": "pwd"
-            },
-            
-            # Service Status
-            "service_status": {
-                "windows": "Get-Service | Where-Object Status -eq 'Running' | Select-Object -First 10 Name, Status",
-                "linux": "systemctl --type=service --state=running | head -10",
-                "macos": "launchctl list | head -10"
-            }
-        }
-    
+        # Both are shared module-level objects; construction is just
+        # two attribute binds
+        self._os_info = _detect_os()
+        self._command_mappings = _COMMAND_MAPPINGS
+
     def get_os_info(self) -> OSInfo:
         """Get current OS information"""
         return self._os_info
@@ -165,47 +207,23 @@ class OSDetection:
         Returns:
             OS-appropriate command
         """
-        intent_lower = intent.lower()
-        
-        # Disk usage patterns
-        if any(phrase in intent_lower for phrase in ["disk usage", "disk space", "free space", "storage"]):
-            return self.map_command("disk_usage")
-        
-        # Process patterns  
-        elif any(phrase in intent_lower for phrase in ["processes", "running", "tasks", "ps aux"]):
-            return self.map_command("list_processes")
-        
-        # Memory patterns
-        elif any(phrase in intent_lower for phrase in ["memory", "ram", "free memory"]):
-            return self.map_command("memory_usage")
-        
-        # Network patterns
-        elif any(phrase in intent_lower for phrase in ["network", "interface", "ip", "adapter"]):
-            return self.map_command("network_info")
-        
-        # Large files patterns
-        elif any(phrase in intent_lower for phrase in ["large files", "big files", "find files", "100mb"]):
-            return self.map_command("find_large_files")
-        
-        # System info patterns
-        elif any(phrase in intent_lower for phrase in ["system info", "system information", "computer info"]):
-            return self.map_command("system_info")
-        
-        # Directory listing patterns
-        elif any(phrase in intent_lower for phrase in ["list files", "show files", "directory", "ls", "dir"]):
-            return self.map_command("list_directory")
-        
-        # Current directory patterns
-        elif any(phrase in intent_lower for phrase in ["current directory", "where am i", "pwd"]):
-            return self.map_command("current_directory")
-        
-        # Service patterns
-        elif any(phrase in intent_lower for phrase in ["services", "running services", "service status"]):
-            return self.map_command("service_status")
-        
-        else:
-            # Fallback: no specific mapping found
-            return f"# No OS-specific mapping found for: {intent}"
+        # Single pass over the intent; among all matching categories the
+        # highest-priority one wins, so the old chain order is preserved
+        best: Optional[str] = None
+        best_rank = len(_INTENT_RANK)
+        for match in _INTENT_RE.finditer(intent):
+            rank = _INTENT_RANK[match.lastgroup]
+            if rank < best_rank:
+                best = match.lastgroup
+                best_rank = rank
+                if rank == 0:
+                    break
+
+        if best is not None:
+            return self.map_command(best)
+
+        # Fallback: no specific mapping found
+        return f"# No OS-specific mapping found for: {intent}"
     
     def get_shell_prefix(self) -> str:
         """Get appropriate shell prefix for the current OS"""
@@ -0,0 +1,143 @@
+"""
+Execution Plan Cache for ChatOps CLI
+
+Caches parsed DevOpsCommand objects keyed by a fingerprint of the user
+request plus session context, so repeat requests (e.g. a daily "check
+disk space") skip both plugin dispatch and the LLM round trip entirely.
+The cache is backed by SQLite under ~/.chatops so it survives sessions.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+from pathlib import Path
+from typing import Optional
+
+from .langchain_integration import CommandType, DevOpsCommand, RiskLevel
+
+# Use orjson's C encoder when installed (the `speed` extra); it is
+# several times faster than stdlib json on the small dicts cached here.
+try:
+    import orjson
+
+    def _dumps(obj: dict) -> str:
+        return orjson.dumps(obj).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    _dumps = json.dumps
+    _loads = json.loads
+
+# Commands containing shell substitution or date-style tokens are likely
+# to embed values that change per invocation — never cache those.
+_DYNAMIC_TOKENS = ("$(", "`", "%Y", "%m", "%d", "%H", "%M", "%S")
+
+
+class PlanCache:
+    """
+    SQLite-backed cache of generated DevOpsCommand plans.
+
+    Keys are SHA-256 fingerprints of (user_input + session_context), so a
+    hit reconstructs the full structured command in milliseconds instead
+    of re-running plugin matching and LLM parsing.
+    """
+
+    def __init__(self, db_path: Optional[Path] = None):
+        self.logger = logging.getLogger(__name__)
+        if db_path is None:
+            db_path = Path.home() / ".chatops" / "plan_cache.db"
+        self.db_path = db_path
+        self._conn: Optional[sqlite3.Connection] = None
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.db_path))
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS plans ("
+                "key TEXT PRIMARY KEY, "
+                "plan TEXT NOT NULL, "
+                "created_at REAL DEFAULT (strftime('%s','now'))"
+                ")"
+            )
+            self._conn.commit()
+        except Exception as e:
+            self.logger.warning(f"Plan cache unavailable: {e}")
+            self._conn = None
+
+    @staticmethod
+    def make_key(user_input: str, context: str = "") -> str:
+        """Compute the cache fingerprint for a request + context pair"""
+        return hashlib.sha256((user_input + (context or "")).encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[DevOpsCommand]:
+        """Look up a cached plan; returns None on miss or cache failure"""
+        if self._conn is None:
+            return None
+        try:
+            row = self._conn.execute(
+                "SELECT plan FROM plans WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            data = _loads(row[0])
+            return DevOpsCommand(
+                command=data["command"],
+                description=data["description"],
+                command_type=CommandType(data["command_type"]),
+                risk_level=RiskLevel(data["risk_level"]),
+                requires_sudo=data.get("requires_sudo", False),
+                requires_confirmation=data.get("requires_confirmation", False),
+                estimated_duration=data.get("estimated_duration", "< 1 second"),
+                prerequisites=data.get("prerequisites", []),
+                alternative_commands=data.get("alternative_commands", []),
+            )
+        except Exception as e:
+            self.logger.warning(f"Plan cache lookup failed: {e}")
+            return None
+
+    def put(self, key: str, command: DevOpsCommand) -> None:
+        """Store a generated plan unless it looks dynamic"""
+        if self._conn is None or not self.is_cacheable(command):
+            return
+        try:
+            plan = _dumps(
+                {
+                    "command": command.command,
+                    "description": command.description,
+                    "command_type": command.command_type.value,
+                    "risk_level": command.risk_level.value,
+                    "requires_sudo": command.requires_sudo,
+                    "requires_confirmation": command.requires_confirmation,
+                    "estimated_duration": command.estimated_duration,
+                    "prerequisites": command.prerequisites,
+                    "alternative_commands": command.alternative_commands,
+                }
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO plans (key, plan) VALUES (?, ?)",
+                (key, plan),
+            )
+            self._conn.commit()
+        except Exception as e:
+            self.logger.warning(f"Plan cache store failed: {e}")
+
+    @staticmethod
+    def is_cacheable(command: DevOpsCommand) -> bool:
+        """Reject plans whose command text embeds per-invocation values"""
+        return not any(token in command.command for token in _DYNAMIC_TOKENS)
+
+    def clear(self) -> None:
+        """Remove all cached plans"""
+        if self._conn is None:
+            return
+        try:
+            self._conn.execute("DELETE FROM plans")
+            self._conn.commit()
+        except Exception as e:
+            self.logger.warning(f"Plan cache clear failed: {e}")
+
+    def close(self) -> None:
+        """Close the underlying database connection"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -0,0 +1,133 @@
+"""
+Prompt Response Cache for ChatOps CLI
+
+Caches LLM response text for `ask` and `explain` requests so repeated
+questions are answered locally instead of round-tripping to Groq.
+DevOps requests are highly repetitive ("check disk space", "restart
+nginx"), so even a simple normalized exact-match cache gets a high hit
+rate. Entries are stored in SQLite under ~/.chatops and expire after a
+configurable TTL.
+"""
+
+import hashlib
+import logging
+import re
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional
+
+# Normalization: lowercase, strip punctuation, collapse whitespace — so
+# "Check disk space!" and "check  disk space" share a cache entry.
+_PUNCT_RE = re.compile(r"[^\w\s/-]")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+_DEFAULT_TTL_SECONDS = 7 * 86400
+
+
+def normalize_request(text: str) -> str:
+    """Normalize a natural-language request into its cache form"""
+    text = _PUNCT_RE.sub("", text.lower())
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+class PromptCache:
+    """
+    SQLite-backed cache of LLM response content.
+
+    Keys combine the CLI command name, the normalized request text, the
+    model, and the explain flag, so `ask` and `explain` responses never
+    collide. A hit replaces a full HTTP + LLM round trip (seconds) with
+    a ~1 ms local lookup.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        ttl_seconds: int = _DEFAULT_TTL_SECONDS,
+    ):
+        self.logger = logging.getLogger(__name__)
+        self.ttl_seconds = ttl_seconds
+        if db_path is None:
+            db_path = Path.home() / ".chatops" / "prompt_cache.db"
+        self.db_path = db_path
+        self._conn: Optional[sqlite3.Connection] = None
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.db_path))
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, "
+                "content TEXT NOT NULL, "
+                "model TEXT, "
+                "created_at REAL NOT NULL"
+                ")"
+            )
+            self._conn.commit()
+        except Exception as e:
+            self.logger.warning(f"Prompt cache unavailable: {e}")
+            self._conn = None
+
+    @staticmethod
+    def make_key(
+        command_name: str,
+        request: str,
+        model: Optional[str] = None,
+        explain: bool = False,
+    ) -> str:
+        """Compute the cache key for a CLI request"""
+        raw = "\x00".join(
+            (command_name, normalize_request(request), model or "", str(explain))
+        )
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Look up cached response content; None on miss or expiry"""
+        if self._conn is None:
+            return None
+        try:
+            row = self._conn.execute(
+                "SELECT content, created_at FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            content, created_at = row
+            if time.time() - created_at > self.ttl_seconds:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+            return content
+        except Exception as e:
+            self.logger.warning(f"Prompt cache lookup failed: {e}")
+            return None
+
+    def put(self, key: str, content: str, model: Optional[str] = None) -> None:
+        """Store response content for later hits"""
+        if self._conn is None or not content:
+            return
+        try:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, content, model, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, content, model, time.time()),
+            )
+            self._conn.commit()
+        except Exception as e:
+            self.logger.warning(f"Prompt cache store failed: {e}")
+
+    def clear(self) -> None:
+        """Remove all cached responses"""
+        if self._conn is None:
+            return
+        try:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+        except Exception as e:
+            self.logger.warning(f"Prompt cache clear failed: {e}")
+
+    def close(self) -> None:
+        """Close the underlying database connection"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
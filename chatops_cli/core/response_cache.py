@@ -0,0 +1,114 @@
+"""
+Persistent LLM Response Cache for ChatOps CLI
+
+In-memory response caches die at process exit, but DevOps users often
+re-run the same query days later. This cache persists successful
+responses to SQLite under ~/.chatops (the same backing store the plan
+and prompt caches use), keyed by the identical fingerprint as the
+in-process exact-match cache, so a warm hit across CLI invocations is a
+local read instead of an API call.
+"""
+
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional
+
+_DEFAULT_TTL_SECONDS = 7 * 86400
+
+
+class ResponseCache:
+    """
+    SQLite-backed cache of raw LLM response payloads.
+
+    Stores (content, model, tokens) rows under the exact-cache key and
+    expires entries after a TTL, so stale answers about a changing
+    system eventually fall out on their own.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        ttl_seconds: int = _DEFAULT_TTL_SECONDS,
+    ):
+        self.logger = logging.getLogger(__name__)
+        if db_path is None:
+            db_path = Path.home() / ".chatops" / "response_cache.db"
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self._conn: Optional[sqlite3.Connection] = None
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.db_path))
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, "
+                "content TEXT NOT NULL, "
+                "model TEXT, "
+                "tokens INTEGER, "
+                "created_at REAL DEFAULT (strftime('%s','now'))"
+                ")"
+            )
+            self._conn.commit()
+        except Exception as e:
+            self.logger.warning(f"Response cache unavailable: {e}")
+            self._conn = None
+
+    def get(self, key: str) -> Optional[tuple[str, Optional[str], Optional[int]]]:
+        """Look up (content, model, tokens); None on miss or expiry"""
+        if self._conn is None:
+            return None
+        try:
+            row = self._conn.execute(
+                "SELECT content, model, tokens, created_at "
+                "FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            if time.time() - row[3] > self.ttl_seconds:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+            return row[0], row[1], row[2]
+        except Exception as e:
+            self.logger.warning(f"Response cache lookup failed: {e}")
+            return None
+
+    def put(
+        self,
+        key: str,
+        content: str,
+        model: Optional[str] = None,
+        tokens: Optional[int] = None,
+    ) -> None:
+        """Store a successful response under its exact-cache key"""
+        if self._conn is None:
+            return
+        try:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, content, model, tokens, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, content, model, tokens, time.time()),
+            )
+            self._conn.commit()
+        except Exception as e:
+            self.logger.warning(f"Response cache store failed: {e}")
+
+    def clear(self) -> None:
+        """Remove all cached responses"""
+        if self._conn is None:
+            return
+        try:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+        except Exception as e:
+            self.logger.warning(f"Response cache clear failed: {e}")
+
+    def close(self) -> None:
+        """Close the underlying database connection"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
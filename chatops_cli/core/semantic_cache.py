@@ -0,0 +1,117 @@
+"""
+Semantic Response Cache for ChatOps CLI
+
+Caches LLM responses keyed by prompt *meaning* rather than exact text,
+so paraphrased requests ("list running processes" vs "show active
+processes") reuse one API call. Embeddings come from fastembed's small
+CPU models; the dependency is optional and the cache degrades to a
+no-op when it isn't installed, mirroring how other optional
+accelerators are handled in this project.
+"""
+
+import logging
+import time
+from typing import Any, Optional
+
+try:
+    import numpy as np
+    from fastembed import TextEmbedding
+
+    FASTEMBED_AVAILABLE = True
+except ImportError:
+    FASTEMBED_AVAILABLE = False
+
+_DEFAULT_MODEL = "BAAI/bge-small-en-v1.5"
+_DEFAULT_TTL_SECONDS = 86400
+
+
+class SemanticCache:
+    """
+    In-memory nearest-neighbour cache over prompt embeddings.
+
+    Entries store the prompt embedding plus a scope string (model + OS),
+    and a lookup returns the cached payload when the best cosine
+    similarity within the same scope clears the threshold. Lookups are
+    a single matrix-vector product over at most max_entries vectors —
+    sub-millisecond against the ~1s network call they replace.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.95,
+        max_entries: int = 512,
+        ttl_seconds: int = _DEFAULT_TTL_SECONDS,
+    ):
+        self.logger = logging.getLogger(__name__)
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._embedder = None
+        # Parallel lists: embedding row i describes entry i
+        self._vectors: list = []
+        self._entries: list[tuple[str, float, Any]] = []  # (scope, stored_at, payload)
+
+    @property
+    def available(self) -> bool:
+        """Whether the optional embedding backend is installed"""
+        return FASTEMBED_AVAILABLE
+
+    def _embed(self, text: str):
+        """Embed text, loading the model lazily on first use"""
+        if self._embedder is None:
+            self._embedder = TextEmbedding(model_name=_DEFAULT_MODEL)
+        vector = next(iter(self._embedder.embed([text])))
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def get(self, prompt: str, scope: str) -> Optional[Any]:
+        """Return the cached payload for the closest prompt, or None"""
+        if not FASTEMBED_AVAILABLE or not self._entries:
+            return None
+        try:
+            # Restrict the search to the query's scope before taking the
+            # argmax: a globally nearer neighbour from another model or
+            # OS must not veto a valid same-scope hit
+            candidates = [
+                i
+                for i, (entry_scope, _, _) in enumerate(self._entries)
+                if entry_scope == scope
+            ]
+            if not candidates:
+                return None
+            query = self._embed(prompt)
+            similarities = np.asarray([self._vectors[i] for i in candidates]) @ query
+            best_pos = int(np.argmax(similarities))
+            if similarities[best_pos] < self.threshold:
+                return None
+            best = candidates[best_pos]
+            _, stored_at, payload = self._entries[best]
+            if time.time() - stored_at > self.ttl_seconds:
+                self._drop(best)
+                return None
+            return payload
+        except Exception as e:
+            self.logger.warning(f"Semantic cache lookup failed: {e}")
+            return None
+
+    def put(self, prompt: str, scope: str, payload: Any) -> None:
+        """Store a payload under the prompt's embedding"""
+        if not FASTEMBED_AVAILABLE:
+            return
+        try:
+            if len(self._entries) >= self.max_entries:
+                self._drop(0)
+            self._vectors.append(self._embed(prompt))
+            self._entries.append((scope, time.time(), payload))
+        except Exception as e:
+            self.logger.warning(f"Semantic cache store failed: {e}")
+
+    def _drop(self, index: int) -> None:
+        """Remove one entry, keeping the parallel lists aligned"""
+        del self._vectors[index]
+        del self._entries[index]
+
+    def clear(self) -> None:
+        """Remove all cached entries"""
+        self._vectors.clear()
+        self._entries.clear()
@@ -113,6 +113,7 @@ class BasePlugin(ABC):
         self._is_initialized = False
         self._capabilities: List[PluginCapability] = []
         self._command_patterns: List[str] = []
+        self._capabilities_str: Optional[str] = None
 
     @property
     @abstractmethod
@@ -130,6 +131,20 @@ class BasePlugin(ABC):
         """Return list of command patterns this plugin can handle"""
         return self._command_patterns.copy()
 
+    @property
+    def capabilities_str(self) -> str:
+        """Comma-separated capability values, joined once and cached.
+
+        Capabilities are fixed after initialize(), so renders (plugin
+        tables, help text) reuse the same string instead of re-joining
+        the enum values on every display.
+        """
+        if self._capabilities_str is None:
+            self._capabilities_str = ", ".join(
+                cap.value for cap in self._capabilities
+            )
+        return self._capabilities_str
+
     @abstractmethod
     async def initialize(self) -> bool:
         """
@@ -252,7 +267,7 @@ Plugin: {self.metadata.name} v{self.metadata.version}
 Description: {self.metadata.description}
 Author: {self.metadata.author}
 
-Capabilities: {', '.join([cap.value for cap in self._capabilities])}
+Capabilities: {self.capabilities_str}
 Command Patterns: {', '.join(self._command_patterns) if self._command_patterns else 'Auto-detected'}
 
 For more information, visit: {self.metadata.website or 'N/A'}
@@ -564,6 +564,27 @@ class PluginManager:
 
         return False
 
+    def reload_plugin_sync(self, plugin_name: str) -> bool:
+        """
+        Synchronous wrapper around reload_plugin for CLI call sites.
+
+        Reuses the thread's event loop when one is set (the CLI keeps a
+        persistent loop alive across commands) instead of constructing
+        and tearing down a throwaway loop for a single await.
+
+        Args:
+            plugin_name: Name of the plugin to reload
+
+        Returns:
+            bool: True if reloaded successfully
+        """
+        try:
+            loop = asyncio.get_event_loop_policy().get_event_loop()
+        except RuntimeError:
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+        return loop.run_until_complete(self.reload_plugin(plugin_name))
+
     async def _reload_plugin_file(self, file_path: Path):
         """
         Reload all plugins from a specific file.
@@ -684,6 +705,17 @@ class PluginManager:
             name: info.instance for name, info in self._plugins.items() if info.instance
         }
 
+    def get_all_plugin_info(self) -> Dict[str, PluginInfo]:
+        """
+        Get detailed information for every loaded plugin in one pass.
+
+        Returns:
+            Dictionary of plugin name to PluginInfo (loaded plugins only)
+        """
+        return {
+            name: info for name, info in self._plugins.items() if info.instance
+        }
+
     def get_plugin_info(self, plugin_name: str) -> Optional[PluginInfo]:
         """
         Get detailed information about a plugin.
@@ -754,9 +786,28 @@ class PluginManager:
                         self._plugins[plugin_name].last_used = datetime.now()
                     return plugin
 
-        # Otherwise, check all plugins in order
-        for plugin in command_plugins:
-            if plugin.can_handle(user_input, context):
+        # Probe all plugins concurrently (can_handle implementations may
+        # do I/O in third-party plugins), then honor priority order when
+        # picking a winner so selection stays deterministic
+        if len(command_plugins) > 1:
+            loop = asyncio.get_running_loop()
+            probes = await asyncio.gather(
+                *[
+                    loop.run_in_executor(
+                        None, plugin.can_handle, user_input, context
+                    )
+                    for plugin in command_plugins
+                ],
+                return_exceptions=True,
+            )
+        else:
+            probes = [
+                plugin.can_handle(user_input, context)
+                for plugin in command_plugins
+            ]
+
+        for plugin, can_handle in zip(command_plugins, probes):
+            if can_handle is True:
                 # Update last used time
                 plugin_name = plugin.metadata.name
                 if plugin_name in self._plugins:
@@ -68,6 +68,7 @@ class LoggingConfig(BaseModel):
     max_log_size: int = 10 * 1024 * 1024  # 10MB
     log_retention_days: int = 30
     include_timestamps: bool = True
+    structured_output: bool = True  # JSON app log; False = plain text
     log_commands: bool = True
     log_errors: bool = True
 
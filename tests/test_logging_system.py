@@ -0,0 +1,56 @@
+"""
+Regression test for audit-record output compression.
+
+Guards two coupled behaviors: the audit logger's DEBUG gate must be
+reachable via settings (otherwise stdout/stderr silently vanish from
+every record), and captured output over the 4KB threshold must land in
+the audit log as a compressed blob that get_audit_trail inflates back.
+"""
+
+import asyncio
+import os
+
+os.environ.setdefault("GROQ_API_KEY", "test-key")
+
+from chatops_cli.settings import settings
+
+
+def test_large_stdout_compressed_and_inflated(tmp_path):
+    settings.logging.level = "DEBUG"
+    settings.logging.log_directory = str(tmp_path)
+
+    from chatops_cli.core.logging_system import EventType, LoggingSystem
+
+    logging_system = LoggingSystem({"log_directory": str(tmp_path)})
+    big_output = "build line\n" * 1000  # well past the 4KB threshold
+
+    asyncio.run(
+        logging_system.log_command_execution(
+            command="make build",
+            return_code=0,
+            stdout=big_output,
+            stderr="short",
+            description="big output",
+        )
+    )
+
+    # Write path: the in-memory event carries the compressed blob, not
+    # the raw multi-KB string
+    event = logging_system.get_command_history()[-1]
+    assert "stdout_zlib_b64" in event.metadata
+    assert "stdout" not in event.metadata
+    assert len(event.metadata["stdout_zlib_b64"]) < len(big_output)
+    # Short output stays plain
+    assert event.metadata["stderr"] == "short"
+
+    # Drain queued records to disk before reading the file back
+    logging_system.cleanup()
+
+    # Read path: get_audit_trail transparently inflates the blob
+    trail = logging_system.get_audit_trail(
+        event_types=[EventType.COMMAND_EXECUTION]
+    )
+    assert trail, "command execution record missing from audit trail"
+    metadata = trail[-1]["metadata"]
+    assert metadata["stdout"] == big_output
+    assert "stdout_zlib_b64" not in metadata